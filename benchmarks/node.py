@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Scaling of the graph routing of :py:mod:`beyond.utils.node`
+
+A small graph of frames is created, to which an increasing number of
+leaves (i.e. ground stations) are attached. For each size, the time to
+build the graph and to compute a path from each leaf is measured.
+
+Usage:
+
+    python benchmarks/node.py [max_size]
+"""
+
+import sys
+from time import perf_counter
+
+from beyond.utils.node import Node
+
+
+def build(size):
+
+    names = ("GCRF", "CIRF", "TIRF", "ITRF", "PEF", "TOD", "MOD", "EME2000")
+    nodes = [Node(name) for name in names]
+    for a, b in zip(nodes[:-1], nodes[1:]):
+        a + b
+
+    itrf = nodes[3]
+    leaves = [Node("Station%d" % i) for i in range(size)]
+    for leaf in leaves:
+        leaf + itrf
+
+    return nodes, leaves
+
+
+def main(max_size=4000):
+
+    print("{:>8} {:>12} {:>12}".format("size", "build (ms)", "paths (ms)"))
+
+    size = 250
+    while size <= max_size:
+        start = perf_counter()
+        nodes, leaves = build(size)
+        built = perf_counter()
+        for leaf in leaves:
+            leaf.path("EME2000")
+        stop = perf_counter()
+
+        print("{:>8} {:>12.2f} {:>12.2f}".format(
+            size, (built - start) * 1000, (stop - built) * 1000
+        ))
+        size *= 2
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:]])
@@ -6,6 +6,7 @@
 All units are in `SI <https://en.wikipedia.org/wiki/International_System_of_Units>`__
 """
 
+import numpy as np
 from numpy import sqrt
 
 
@@ -23,7 +24,7 @@ class Body:
     """Generic class for the description of physical caracteristics of celestial body
     """
 
-    def __init__(self, name, mass, equatorial_radius, *, flattening=1):
+    def __init__(self, name, mass, equatorial_radius, *, flattening=0):
         self.name = name
         """Name of the celestial body"""
         self.mass = mass
@@ -68,6 +69,70 @@ class Body:
         """
         return self.r * (1 - self.f)
 
+    def geodetic_to_cartesian(self, lla):
+        """Conversion from geodetic coordinates to cartesian, with respect to
+        the ellipsoid of the body
+
+        Args:
+            lla (numpy.ndarray): Latitude (radians), longitude (radians) and
+                altitude (meters), of shape (3,) or (N, 3)
+        Return:
+            numpy.ndarray: Cartesian coordinates in a body-fixed frame, in
+            meters, of the same shape as ``lla``
+        """
+
+        lat, lon, alt = np.moveaxis(np.asarray(lla, dtype=float), -1, 0)
+
+        # Radius of curvature in the prime vertical
+        N = self.r / sqrt(1 - (self.e * np.sin(lat)) ** 2)
+
+        return np.stack([
+            (N + alt) * np.cos(lat) * np.cos(lon),
+            (N + alt) * np.cos(lat) * np.sin(lon),
+            (N * (1 - self.e ** 2) + alt) * np.sin(lat)
+        ], axis=-1)
+
+    def cartesian_to_geodetic(self, coord):
+        """Conversion from cartesian coordinates to geodetic, with respect to
+        the ellipsoid of the body
+
+        The closed-form solution of Vermeille (*Direct transformation from
+        geocentric coordinates to geodetic coordinates*, Journal of Geodesy 76,
+        2002) is used. It is valid everywhere except deep inside the
+        body (less than ~40 km from the center of the Earth).
+
+        Args:
+            coord (numpy.ndarray): Cartesian coordinates in a body-fixed frame,
+                of shape (3,) or (N, 3). Only the first three components are
+                used, so (N, 6) states are accepted as well.
+        Return:
+            numpy.ndarray: Latitude (radians), longitude (radians) and altitude
+            (meters), of shape (3,) or (N, 3)
+        """
+
+        coord = np.asarray(coord, dtype=float)
+        x, y, z = np.moveaxis(coord[..., :3], -1, 0)
+
+        e2 = self.e ** 2
+        rho = sqrt(x ** 2 + y ** 2)
+
+        p = (rho / self.r) ** 2
+        q = (1 - e2) * (z / self.r) ** 2
+        r = (p + q - e2 ** 2) / 6
+        s = e2 ** 2 * p * q / (4 * r ** 3)
+        t = np.cbrt(1 + s + sqrt(s * (2 + s)))
+        u = r * (1 + t + 1 / t)
+        v = sqrt(u ** 2 + e2 ** 2 * q)
+        w = e2 * (u + v - q) / (2 * v)
+        k = sqrt(u + v + w ** 2) - w
+        D = k * rho / (k + e2)
+
+        lat = 2 * np.arctan2(z, D + sqrt(D ** 2 + z ** 2))
+        lon = np.arctan2(y, x)
+        alt = (k + e2 - 1) / k * sqrt(D ** 2 + z ** 2)
+
+        return np.stack([lat, lon, alt], axis=-1)
+
 
 Earth = Body(
     name="Earth",
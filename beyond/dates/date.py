@@ -6,17 +6,46 @@
 from datetime import datetime, timedelta
 from numpy import sin, radians
 
+import numpy as np
+
 from ..errors import DateError, UnknownScaleError
-from .eop import EopDb
+from .eop import EopDb, Eop
 from ..utils.node import Node
 
-__all__ = ['Date', 'timedelta']
+__all__ = ['Date', 'DateArray', 'timedelta']
+
+
+class ScalePlan(tuple):
+    """Compiled conversion between two time-scales, as returned by :py:meth:`Timescale.plan`
+
+    Each element is a couple containing the sign to apply to the result of an
+    elementary operation, and the operation itself.
+    """
+
+    def __new__(cls, operations):
+        obj = super().__new__(cls, operations)
+        names = {oper.__name__ for sign, oper in operations}
+
+        obj.needs_eop = bool(names & Timescale.EOP_DEPENDENT)
+        """True if the conversion needs Earth Orientation Parameters"""
+
+        obj.variable = bool(names & Timescale.TIME_DEPENDENT)
+        """True if the value of the conversion varies continuously with time. If False, the value
+        is either constant, or changes only at day boundaries (leap seconds)"""
+
+        return obj
 
 
 class Timescale(Node):
     """Definition of a time scale and its interactions with others
     """
 
+    EOP_DEPENDENT = {'_scale_ut1_minus_utc', '_scale_tai_minus_utc'}
+    """Elementary operations requiring Earth Orientation Parameters"""
+
+    TIME_DEPENDENT = {'_scale_ut1_minus_utc', '_scale_tdb_minus_tt'}
+    """Elementary operations whose value varies continuously with time"""
+
     def __repr__(self):  # pragma: no cover
         return "<Scale '%s'>" % self.name
 
@@ -52,34 +81,66 @@ class Timescale(Node):
         delta_lambda = radians(246.11 + 0.90251792 * (jd - 2451545.))
         return 0.001657 * sin(m) + 0.000022 * sin(delta_lambda)
 
+    def plan(self, new_scale):
+        """Compile the list of elementary operations necessary in order to convert
+        from this time-scale to another one.
+
+        The result is cached, so the graph of time-scales is only walked once per
+        couple of scales.
+
+        Args:
+            new_scale (str): Name of the desired scale
+        Return:
+            ScalePlan: Each element is the sign to apply to the result of a
+            callable, which takes the MJD and the EOP as arguments.
+        """
+
+        key = (self.name, str(new_scale))
+
+        if key not in _plans:
+            plan = []
+            for one, two in self.steps(str(new_scale)):
+                one = one.name.lower()
+                two = two.name.lower()
+                # find the operation
+                oper = "_scale_{}_minus_{}".format(two, one)
+                # find the reverse operation
+                roper = "_scale_{}_minus_{}".format(one, two)
+                if hasattr(self, oper):
+                    plan.append((1, getattr(self, oper)))
+                elif hasattr(self, roper):
+                    plan.append((-1, getattr(self, roper)))
+                else:  # pragma: no cover
+                    raise DateError("Unknown convertion {} => {}".format(one, two))
+
+            _plans[key] = ScalePlan(plan)
+
+        return _plans[key]
+
     def offset(self, mjd, new_scale, eop):
         """Compute the offset necessary in order to convert from one time-scale to another
 
         Args:
-            mjd (float):
+            mjd (float or numpy.ndarray):
             new_scale (str): Name of the desired scale
+            eop (Eop): If ``mjd`` is an array, the attributes of this object
+                should be arrays of the same shape, or scalars.
         Return:
-            float: offset to apply in seconds
-        """
-
-        delta = 0
-        for one, two in self.steps(new_scale):
-            one = one.name.lower()
-            two = two.name.lower()
-            # find the operation
-            oper = "_scale_{}_minus_{}".format(two, one)
-            # find the reverse operation
-            roper = "_scale_{}_minus_{}".format(one, two)
-            if hasattr(self, oper):
-                delta += getattr(self, oper)(mjd, eop)
-            elif hasattr(self, roper):
-                delta -= getattr(self, roper)(mjd, eop)
-            else:  # pragma: no cover
-                raise DateError("Unknown convertion {} => {}".format(one, two))
+            float or numpy.ndarray: offset to apply in seconds
+        """
+
+        delta = 0.
+        for sign, oper in self.plan(new_scale):
+            delta += sign * oper(mjd, eop)
 
         return delta
 
 
+_plans = {}
+"""Cache of compiled conversions between two time-scales, see :py:meth:`Timescale.plan`
+"""
+
+
 UT1 = Timescale('UT1')  # Universal Time
 GPS = Timescale('GPS')  # GPS Time
 TDB = Timescale('TDB')  # Barycentric Dynamical Time
@@ -142,12 +203,10 @@ class Date:
     Date objects interact with :py:class:`timedelta` as datetime do.
 
     Attributes:
-        eop: Value of the Earth Orientation Parameters for this particular date (see
-            :ref:`eop`)
         scale: Scale in which this date is represented
     """
 
-    __slots__ = ["_d", "_s", "_offset", "scale", "_cache", "eop"]
+    __slots__ = ["_d", "_s", "_offset", "scale", "_cache", "_eop"]
 
     MJD_T0 = datetime(1858, 11, 17)
     """Origin of MJD"""
@@ -199,15 +258,31 @@ class Date:
 
         mjd = d + s / 86400.
 
-        # Retrieve EOP for the given date and store
-        eop = EopDb.get(mjd)
+        # Retrieve EOP for the given date only if needed by the conversion to
+        # REF_SCALE. Otherwise, the retrieval is deferred until the first access
+        # to the 'eop' attribute
+        eop = EopDb.get(mjd) if scale.plan(self.REF_SCALE).needs_eop else None
 
         # Retrieve the offset from REF_SCALE for the current date
         offset = scale.offset(mjd, self.REF_SCALE, eop)
 
+        self._set(d, s, offset, scale, eop)
+
+    def _set(self, d, s, offset, scale, eop):
+        """Initialisation of the internal representation from the date expressed in
+        its scale, and the offset from this scale to REF_SCALE
+        """
+
         d += int((s + offset) // 86400)
         s = (s + offset) % 86400.
 
+        self._set_ref(d, s, offset, scale, eop)
+
+    def _set_ref(self, d, s, offset, scale, eop):
+        """Initialisation of the internal representation, from the date expressed in
+        REF_SCALE, and the offset from the scale of the date to REF_SCALE
+        """
+
         # As Date acts like an immutable object, we can't set its attributes normally
         # like when we do ``self._d = _d``. Furthermore, those attribute represent the date with
         # respect to REF_SCALE
@@ -215,9 +290,18 @@ class Date:
         super().__setattr__('_s', s)
         super().__setattr__('_offset', offset)
         super().__setattr__('scale', scale)
-        super().__setattr__('eop', eop)
+        super().__setattr__('_eop', eop)
         super().__setattr__('_cache', {})
 
+    @property
+    def eop(self):
+        """Value of the Earth Orientation Parameters for this particular date (see
+        :ref:`eop`)
+        """
+        if self._eop is None:
+            super().__setattr__('_eop', EopDb.get(self.mjd))
+        return self._eop
+
     def __getstate__(self):  # pragma: no cover
         """Used for pickling"""
         return {
@@ -225,7 +309,7 @@ class Date:
             's': self._s,
             'offset': self._offset,
             'scale': self.scale,
-            'eop': self.eop,
+            'eop': self._eop,
         }
 
     def __setstate__(self, state):  # pragma: no cover
@@ -234,7 +318,7 @@ class Date:
         super().__setattr__('_s', state['s'])
         super().__setattr__('_offset', state['offset'])
         super().__setattr__('scale', state['scale'])
-        super().__setattr__('eop', state['eop'])
+        super().__setattr__('_eop', state['eop'])
         super().__setattr__('_cache', {})
 
     def __setattr__(self, *args):  # pragma: no cover
@@ -245,39 +329,93 @@ class Date:
 
     def __add__(self, other):
         if isinstance(other, timedelta):
-            days, sec = divmod(other.total_seconds() + self.s, 86400)
+            return self.add_seconds(other.total_seconds())
         else:
             raise TypeError("Unknown operation with {}".format(type(other)))
 
-        return self.__class__(self.d + int(days), sec, scale=self.scale)
-
     def __sub__(self, other):
         if isinstance(other, timedelta):
-            other = timedelta(seconds=-other.total_seconds())
+            return self.add_seconds(-other.total_seconds())
         elif isinstance(other, datetime):
             return self.datetime - other
         elif isinstance(other, Date):
-            return self._datetime - other._datetime
+            return timedelta(days=self._d - other._d, seconds=self._s - other._s)
         else:
             raise TypeError("Unknown operation with {}".format(type(other)))
 
-        return self.__add__(other)
+    def add_seconds(self, seconds):
+        """Shift the date by a given number of seconds
+
+        Contrary to the addition of a :py:class:`~datetime.timedelta`, this
+        method is not limited to the microsecond resolution.
+
+        Args:
+            seconds (float): Positive or negative number of seconds
+        Return:
+            Date
+        """
+        d, s = self._convert_to_scale()
+        days, sec = divmod(seconds + s, 86400)
+
+        new_d = d + int(days)
+        plan = self.scale.plan(self.REF_SCALE)
+
+        if plan.variable or (plan.needs_eop and new_d != d):
+            return self.__class__(new_d, sec, scale=self.scale)
+
+        # The offset between the scale of the date and REF_SCALE is the same as
+        # for self, either because it's constant or because it only changes at
+        # day boundaries (i.e. leap seconds). There is no need to query for EOP
+        # or to compute the offset again.
+        new = self.__class__.__new__(self.__class__)
+        new._set(new_d, sec, self._offset, self.scale, None)
+        return new
+
+    def seconds_since(self, other):
+        """Elapsed time between two dates, computed directly from their internal
+        representation.
+
+        Contrary to the subtraction of two dates, which gives a
+        :py:class:`~datetime.timedelta`, this method is not limited to the
+        microsecond resolution.
+
+        Args:
+            other (Date)
+        Return:
+            float: Number of seconds from ``other`` to ``self``
+        """
+        return (self._d - other._d) * 86400. + (self._s - other._s)
 
     def __gt__(self, other):
+        if not isinstance(other, (Date, DateArray)):
+            return NotImplemented
         return self._mjd > other._mjd
 
     def __ge__(self, other):
+        if not isinstance(other, (Date, DateArray)):
+            return NotImplemented
         return self._mjd >= other._mjd
 
     def __lt__(self, other):
+        if not isinstance(other, (Date, DateArray)):
+            return NotImplemented
         return self._mjd < other._mjd
 
     def __le__(self, other):
+        if not isinstance(other, (Date, DateArray)):
+            return NotImplemented
         return self._mjd <= other._mjd
 
     def __eq__(self, other):
+        if not isinstance(other, (Date, DateArray)):
+            return NotImplemented
         return self._mjd == other._mjd
 
+    def __hash__(self):
+        # Consistent with __eq__: the same instant gives the same hash,
+        # whatever the scale
+        return hash(self._mjd)
+
     def __repr__(self):  # pragma: no cover
         return "<{} '{}'>".format(self.__class__.__name__, self)
 
@@ -367,11 +505,33 @@ class Date:
             new_scale (str)
         Return:
             Date
+
+        The resulting Date shares its internal representation and EOP with ``self``,
+        only the offset to the new scale is computed. Successive calls with the same
+        scale return the same object.
         """
-        offset = self.scale.offset(self._mjd, new_scale, self.eop)
-        result = self.datetime + timedelta(seconds=offset)
 
-        return self.__class__(result, scale=new_scale)
+        if str(new_scale) == self.scale.name:
+            return self
+
+        key = ('scale', str(new_scale))
+
+        if key not in self._cache:
+            ref = get_scale(self.REF_SCALE)
+            eop = self.eop if ref.plan(new_scale).needs_eop else self._eop
+
+            # The date doesn't change in REF_SCALE, only the offset does.
+            # This offset is evaluated at the date expressed in the new scale
+            mjd = self._mjd + ref.offset(self._mjd, new_scale, eop) / 86400.
+            offset = get_scale(str(new_scale)).offset(mjd, self.REF_SCALE, eop)
+
+            new = self.__class__.__new__(self.__class__)
+            new._set_ref(self._d, self._s, offset, get_scale(str(new_scale)), eop)
+            new._cache[('scale', self.scale.name)] = self
+
+            self._cache[key] = new
+
+        return self._cache[key]
 
     @classmethod
     def _julian_century(cls, jd):
@@ -454,3 +614,312 @@ class Date:
         while getattr(date, oper)(stop):
             yield date
             date += step
+
+
+class DateArray:
+    """Vectorized counterpart of :py:class:`Date`
+
+    A DateArray holds a whole grid of epochs sharing the same scale. As with
+    :py:class:`Date`, the epochs are stored internally as integer days and seconds
+    in the day, with respect to the REF_SCALE time-scale, but in the form of
+    :py:class:`numpy.ndarray`.
+
+    The constructor can take:
+
+        * an iterable of :py:class:`Date` objects
+        * MJD as an array of :py:class:`float`
+        * MJD as an array of :py:class:`int` for days and an array of :py:class:`float`
+          for seconds
+
+    Keyword Arguments:
+        scale (str) : One of the following scales : "UT1", "UTC", "GPS", "TDB", "TAI", "TT"
+
+    Examples:
+
+        .. code-block:: python
+
+            DateArray([Date(2016, 11, 17), Date(2016, 11, 18)])
+            DateArray([57709.804455, 57709.804456])  # MJD
+            DateArray([57709, 57709], [69540.752649, 69541.752649])
+            DateArray.range(Date(2016, 11, 17), timedelta(days=1), timedelta(seconds=10))
+
+    Accessing a single element returns a :py:class:`Date` object, while slicing returns
+    a DateArray.
+
+    Attributes:
+        scale: Scale in which these dates are represented
+    """
+
+    __slots__ = ["_d", "_s", "_offset", "scale", "_eop"]
+
+    REF_SCALE = Date.REF_SCALE
+    DEFAULT_SCALE = Date.DEFAULT_SCALE
+
+    def __init__(self, *args, scale=None):
+
+        eop = None
+
+        if len(args) == 1:
+            arg = args[0]
+            if isinstance(arg, DateArray):
+                if scale is not None:
+                    arg = arg.change_scale(str(scale))
+                d, s, scale, eop = arg.d, arg.s, arg.scale, arg.eop
+            else:
+                arg = list(arg) if not isinstance(arg, np.ndarray) else arg
+                if len(arg) and isinstance(arg[0], Date):
+                    scale = arg[0].scale if scale is None else get_scale(str(scale).upper())
+                    # Conversion of all dates into the same scale
+                    dates = [x if x.scale is scale else x.change_scale(scale.name) for x in arg]
+                    d = np.array([x.d for x in dates], dtype=int)
+                    s = np.array([x.s for x in dates], dtype=float)
+                    if all(x._eop is not None for x in dates):
+                        # The EOP are already available in each Date object
+                        eop = Eop(**{
+                            name: np.array([getattr(x._eop, name) for x in dates], dtype=float)
+                            for name in Eop.FIELDS
+                        })
+                else:
+                    # Modified Julian Day
+                    mjd = np.asarray(arg, dtype=float)
+                    d = np.floor(mjd).astype(int)
+                    s = (mjd - d) * 86400.
+        elif len(args) == 2:
+            # Julian days and seconds in the day
+            d = np.asarray(args[0], dtype=int)
+            s = np.asarray(args[1], dtype=float)
+        else:
+            raise TypeError("Unknown type sequence {}".format(
+                ", ".join(str(type(x)) for x in args)
+            ))
+
+        scale = self.DEFAULT_SCALE if scale is None else scale
+        self._set(d, s, scale, eop)
+
+    def _set(self, d, s, scale, eop=None):
+        """Initialisation of the internal representation from days and seconds
+        expressed in the given scale
+        """
+
+        if isinstance(scale, str):
+            scale = get_scale(scale.upper())
+
+        d, s = np.broadcast_arrays(np.asarray(d, dtype=int), np.asarray(s, dtype=float))
+        mjd = d + s / 86400.
+
+        # Retrieve EOP for the given dates, only if needed by the conversion
+        if eop is None and scale.plan(self.REF_SCALE).needs_eop:
+            eop = EopDb.get_many(mjd)
+
+        # Retrieve the offset from REF_SCALE for the current dates
+        offset = np.broadcast_to(scale.offset(mjd, self.REF_SCALE, eop), d.shape)
+
+        self._d = d + ((s + offset) // 86400).astype(int)
+        self._s = (s + offset) % 86400.
+        self._offset = offset
+        self.scale = scale
+        self._eop = eop
+
+    @property
+    def eop(self):
+        """Value of the Earth Orientation Parameters for these dates (see :ref:`eop`).
+        Each attribute of this object is an array.
+        """
+        if self._eop is None:
+            self._eop = EopDb.get_many(self.mjd)
+        return self._eop
+
+    @classmethod
+    def _from_ref(cls, d, s, offset, scale, eop):
+        """Build a DateArray directly from its internal representation,
+        without any EOP query or offset computation
+        """
+        new = cls.__new__(cls)
+        new._d = d
+        new._s = s
+        new._offset = offset
+        new.scale = scale
+        new._eop = eop
+        return new
+
+    def __len__(self):
+        return len(self._d)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            d, s = self._convert_to_scale()
+            return Date(int(d[key]), float(s[key]), scale=self.scale)
+
+        eop = self._eop
+        if eop is not None:
+            eop = Eop(**{
+                name: np.broadcast_to(getattr(eop, name), self._d.shape)[key]
+                for name in Eop.FIELDS
+            })
+        return self._from_ref(self._d[key], self._s[key], self._offset[key], self.scale, eop)
+
+    def __add__(self, other):
+        if isinstance(other, timedelta):
+            other = other.total_seconds()
+        elif not isinstance(other, (np.ndarray, float, int)):
+            raise TypeError("Unknown operation with {}".format(type(other)))
+
+        d, s = self._convert_to_scale()
+        days, sec = np.divmod(s + other, 86400)
+
+        return self.__class__(d + days.astype(int), sec, scale=self.scale)
+
+    def __sub__(self, other):
+        """Subtraction of a :py:class:`~datetime.timedelta` gives a new DateArray, whereas
+        subtraction of a :py:class:`Date` or :py:class:`DateArray` gives the elapsed
+        time in seconds, as an array of floats.
+        """
+        if isinstance(other, (Date, DateArray)):
+            return (self._d - other._d) * 86400. + (self._s - other._s)
+        elif isinstance(other, timedelta):
+            other = other.total_seconds()
+        elif not isinstance(other, (np.ndarray, float, int)):
+            raise TypeError("Unknown operation with {}".format(type(other)))
+
+        return self.__add__(-other)
+
+    def __gt__(self, other):
+        return self._mjd > other._mjd
+
+    def __ge__(self, other):
+        return self._mjd >= other._mjd
+
+    def __lt__(self, other):
+        return self._mjd < other._mjd
+
+    def __le__(self, other):
+        return self._mjd <= other._mjd
+
+    def __eq__(self, other):
+        return self._mjd == other._mjd
+
+    def __ne__(self, other):
+        return self._mjd != other._mjd
+
+    __hash__ = None
+
+    def __repr__(self):  # pragma: no cover
+        if len(self) == 0:
+            return "<{} (empty) {}>".format(self.__class__.__name__, self.scale)
+        return "<{} '{}' -> '{}' ({} elements)>".format(
+            self.__class__.__name__, self[0], self[-1], len(self)
+        )
+
+    def _convert_to_scale(self):
+        """Convert the inner values (defined with respect to REF_SCALE) into the given scale
+        of the object
+        """
+        s = (self._s - self._offset) % 86400.
+        d = self._d - ((s + self._offset) // 86400).astype(int)
+        return d, s
+
+    @property
+    def d(self):
+        return self._convert_to_scale()[0]
+
+    @property
+    def s(self):
+        return self._convert_to_scale()[1]
+
+    @property
+    def _mjd(self):
+        """
+        Return:
+            numpy.ndarray: Dates in terms of MJD in the REF_SCALE timescale
+        """
+        return self._d + self._s / 86400.
+
+    @property
+    def mjd(self):
+        """Dates in terms of MJD
+
+        Return:
+            numpy.ndarray
+        """
+        d, s = self._convert_to_scale()
+        return d + s / 86400.
+
+    @property
+    def jd(self):
+        """Compute the Julian Dates
+
+        Return:
+            numpy.ndarray
+        """
+        return self.mjd + Date.JD_MJD
+
+    @property
+    def julian_century(self):
+        """Compute the julian_century of the dates relatively to their scale
+
+        Return:
+            numpy.ndarray
+        """
+        return Date._julian_century(self.jd)
+
+    def change_scale(self, new_scale):
+        """
+        Args:
+            new_scale (str)
+        Return:
+            DateArray
+        """
+        ref = get_scale(self.REF_SCALE)
+        eop = self.eop if ref.plan(new_scale).needs_eop else self._eop
+
+        # The dates don't change in REF_SCALE, only the offset does.
+        # This offset is evaluated at the dates expressed in the new scale
+        mjd = self._mjd + ref.offset(self._mjd, new_scale, eop) / 86400.
+        offset = get_scale(str(new_scale)).offset(mjd, self.REF_SCALE, eop)
+        offset = np.broadcast_to(offset, self._d.shape)
+
+        return self._from_ref(self._d, self._s, offset, get_scale(str(new_scale)), eop)
+
+    @classmethod
+    def range(cls, start, stop, step, inclusive=False):
+        """Vectorized equivalent of :py:meth:`Date.range`
+
+        Args:
+            start (Date):
+            stop (Date or datetime.timedelta)!
+            step (timedelta):
+        Keyword Args:
+            inclusive (bool): If ``False``, the stopping date is not included.
+        Return:
+            DateArray:
+        """
+
+        if not step:
+            raise ValueError("Null step")
+
+        if isinstance(stop, timedelta):
+            stop = start + stop
+
+        step = step.total_seconds()
+        span = (stop._d - start._d) * 86400. + (stop._s - start._s)
+
+        if span and np.sign(span) != np.sign(step):
+            raise ValueError("start/stop order not coherent with step")
+
+        # One more element than necessary, as rounding errors are
+        # handled by the filtering below
+        seconds = np.arange(int(span // step) + 2) * step
+
+        days, sec = np.divmod(start.s + seconds, 86400)
+        dates = cls(start.d + days.astype(int), sec, scale=start.scale)
+
+        if step > 0:
+            keep = dates <= stop if inclusive else dates < stop
+        else:
+            keep = dates >= stop if inclusive else dates > stop
+
+        return dates[keep]
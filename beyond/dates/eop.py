@@ -4,7 +4,12 @@
 """Retrieve and interpolate data for Earth Orientation and timescales conversions
 """
 
+import os
+import time
 import warnings
+import threading
+import numpy as np
+from bisect import bisect_right
 from pathlib import Path
 from inspect import isclass
 from pkg_resources import iter_entry_points
@@ -12,10 +17,85 @@ from pkg_resources import iter_entry_points
 from ..config import config
 from ..errors import EopError, EopWarning, ConfigError
 
-__all__ = ["register", "EopDb", "TaiUtc", "Finals", "Finals2000A"]
+__all__ = ["register", "EopDb", "LeapSeconds", "TaiUtc", "Finals", "Finals2000A"]
 
 
-class TaiUtc():
+class LeapSeconds():
+    """Table of leap seconds, sorted by date
+
+    Args:
+        data (list of tuple): Couples of MJD (int) and TAI-UTC values (float)
+
+    Each leap second defines the start of a segment of time during which
+    TAI-UTC is constant. Scalar lookups are done by bisection, and lookups on
+    arrays of dates by :py:func:`numpy.searchsorted`.
+    """
+
+    def __init__(self, data):
+
+        self.data = sorted(data)
+
+        self.dates = [mjd for mjd, value in self.data]
+        """Dates of leap seconds, i.e. boundaries of the segments"""
+
+        self.values = [value for mjd, value in self.data]
+        """TAI-UTC values, for each segment"""
+
+        self._dates = np.array(self.dates, dtype=float)
+        self._values = np.array(self.values, dtype=float)
+
+    def _index(self, date):
+        i = bisect_right(self.dates, date) - 1
+        if i < 0:
+            raise KeyError(date)
+        return i
+
+    def __getitem__(self, date):
+        return self.values[self._index(date)]
+
+    def get_many(self, dates):
+        """Vectorized version of ``__getitem__``
+
+        Args:
+            dates (numpy.ndarray): Dates in MJD
+        Return:
+            numpy.ndarray: TAI-UTC values for each date
+        """
+        idx = np.searchsorted(self._dates, dates, side='right') - 1
+        if (idx < 0).any():
+            raise KeyError(float(np.asarray(dates)[idx < 0][0]))
+        return self._values[idx]
+
+    def get_last_next(self, date):
+        """Provide the last and next leap-second events relative to a date
+
+        Args:
+            date (float): Date in MJD
+        Return:
+            tuple:
+        """
+        i = bisect_right(self.dates, date)
+
+        past = self.data[i - 1] if i > 0 else (None, None)
+        future = self.data[i] if i < len(self.data) else (None, None)
+
+        return past, future
+
+    def segment(self, date):
+        """Boundaries of the segment of constant TAI-UTC containing a date
+
+        Args:
+            date (float): Date in MJD
+        Return:
+            tuple: Starting MJD (included) and ending MJD (excluded) of the segment.
+            The end of the last segment is infinite.
+        """
+        i = self._index(date)
+        stop = self.dates[i + 1] if i + 1 < len(self.dates) else float('inf')
+        return self.dates[i], stop
+
+
+class TaiUtc(LeapSeconds):
     """File listing all leap seconds throught history
 
     This file can be retrieved `here <http://maia.usno.navy.mil/ser7/tai-utc.dat>`__.
@@ -24,7 +104,7 @@ class TaiUtc():
     def __init__(self, path):
 
         self.path = Path(path)
-        self.data = []
+        data = []
 
         with self.path.open() as fhandler:
             lines = fhandler.read().splitlines()
@@ -36,32 +116,11 @@ class TaiUtc():
             line = line.split()
             mjd = int(float(line[4]) - 2400000.5)
             value = float(line[6])
-            self.data.append(
+            data.append(
                 (mjd, value)
             )
 
-    def __getitem__(self, date):
-        for mjd, value in reversed(self.data):
-            if mjd <= date:
-                return value
-
-    def get_last_next(self, date):
-        """Provide the last and next leap-second events relative to a date
-
-        Args:
-            date (float): Date in MJD
-        Return:
-            tuple:
-        """
-        past, future = (None, None), (None, None)
-
-        for mjd, value in reversed(self.data):
-            if mjd <= date:
-                past = (mjd, value)
-                break
-            future = (mjd, value)
-
-        return past, future
+        super().__init__(data)
 
 
 class Finals2000A():
@@ -157,6 +216,8 @@ class Eop:
     """Earth Orientation Parameters
     """
 
+    FIELDS = ('x', 'y', 'dx', 'dy', 'deps', 'dpsi', 'lod', 'ut1_utc', 'tai_utc')
+
     def __init__(self, **kwargs):
         self.x = kwargs['x']
         self.y = kwargs['y']
@@ -175,6 +236,64 @@ class Eop:
         )
 
 
+def _lagrange_one(rows, pos, order):
+    """Lagrange interpolation of all the columns of a table with one line per
+    day, without numpy. This reduces to a linear interpolation if ``order`` is 2
+
+    Args:
+        rows (list of list of float): Table of values
+        pos (float): Position of the date in the table, in days
+        order (int): Number of points used for the interpolation
+    Return:
+        list of float: one element per column
+    """
+
+    start = min(max(int(pos) - (order - 1) // 2, 0), len(rows) - order)
+
+    result = [0.] * len(rows[0])
+    for j in range(order):
+        l_j = 1.
+        for m in range(order):
+            if m != j:
+                l_j *= (pos - start - m) / (j - m)
+        result = [r + l_j * y for r, y in zip(result, rows[start + j])]
+
+    return result
+
+
+def _lagrange(data, pos, order):
+    """Vectorized version of :py:func:`_lagrange_one`
+
+    Args:
+        data (numpy.ndarray): 2D table of values, one line per day
+        pos (numpy.ndarray): 1D array of positions in the table, in days
+        order (int): Number of points used for the interpolation
+    Return:
+        numpy.ndarray: 2D array, one line per position, one column per
+        column of ``data``
+    """
+
+    # Index of the first point used for the interpolation of each date
+    start = np.clip(np.floor(pos).astype(int) - (order - 1) // 2, 0, len(data) - order)
+
+    # Lagrange polynomials evaluated on a regular grid
+    #        k
+    # L(x) = Σ y_j * l_j(x)
+    #        j=0
+    #
+    # l_j(x) = Π (x - x_m) / (x_j - x_m)
+    #     0 <= m <= k
+    #        m != j
+    x = start[:, None] + np.arange(order)
+    weights = np.ones((len(pos), order))
+    for j in range(order):
+        for m in range(order):
+            if m != j:
+                weights[:, j] *= (pos - x[:, m]) / (j - m)
+
+    return np.einsum('nk,nkc->nc', weights, data[x])
+
+
 class EopDb:
     """Class handling the different EOP databases available, in a simple abstraction layer.
 
@@ -185,6 +304,10 @@ class EopDb:
     """
 
     _dbs = {}
+    _classes = {}
+    _lock = threading.Lock()
+    _last_check = 0.
+
     DEFAULT_DBNAME = "default"
     """Default name used for EOP database lookup."""
 
@@ -195,6 +318,11 @@ class EopDb:
     MIS_DEFAULT = ERROR
     """Default behaviour in case of missing value"""
 
+    version = 0
+    """Counter incremented each time a database is instanciated or reloaded.
+    Caches of values depending on EOP are emptied when it changes.
+    """
+
     @classmethod
     def _load_entry_points(cls):
 
@@ -204,6 +332,18 @@ class EopDb:
                 EopDb.register(entry.load(), entry.name)
             cls._entry_points_loaded = True
 
+    @classmethod
+    def _dbname(cls, dbname=None):
+
+        cls._load_entry_points()
+
+        dbname = dbname or config.get('eop', 'dbname', fallback=cls.DEFAULT_DBNAME)
+
+        if dbname not in cls._dbs.keys():
+            raise EopError("Unknown database '%s'" % dbname)
+
+        return dbname
+
     @classmethod
     def db(cls, dbname=None):
         """Retrieve the database
@@ -215,29 +355,102 @@ class EopDb:
             object
         """
 
-        cls._load_entry_points()
-
-        dbname = dbname or config.get('eop', 'dbname', fallback=cls.DEFAULT_DBNAME)
+        dbname = cls._dbname(dbname)
 
-        if dbname not in cls._dbs.keys():
-            raise EopError("Unknown database '%s'" % dbname)
+        # Periodic check of the freshness of the database
+        # (see :ref:`refresh <eop-refresh>` configuration)
+        interval = config.get('eop', 'refresh', fallback=None)
+        if interval is not None and time.monotonic() - cls._last_check > interval:
+            cls._last_check = time.monotonic()
+            try:
+                cls.refresh(dbname)
+            except EopError as e:
+                # The data may be read while being written. The current
+                # instance is kept until the next check
+                msg = "Refresh of the EOP database '{}' failed: {}".format(dbname, e.__cause__ or e)
+                warnings.warn(msg, EopWarning)
 
         if isclass(cls._dbs[dbname]):
-            # Instanciation
+            cls._instanciate(dbname)
+
+        if isinstance(cls._dbs[dbname], Exception):
+            raise EopError("Problem at database instanciation") from cls._dbs[dbname]
+
+        return cls._dbs[dbname]
+
+    @classmethod
+    def _instanciate(cls, dbname, reload=False):
+
+        with cls._lock:
+            if not reload and not isclass(cls._dbs[dbname]):
+                # Already instanciated by another thread
+                return
+
             try:
-                cls._dbs[dbname] = cls._dbs[dbname]()
+                db = cls._classes[dbname]()
             except Exception as e:
+                if reload and not isinstance(cls._dbs[dbname], Exception):
+                    # The previous instance is kept, as it is still usable
+                    raise EopError("Problem at database instanciation") from e
+
                 # Keep the exception in cache in order to not retry instanciation
                 # every single time EopDb.db() is called, as instanciation
                 # of database is generally a time consumming operation.
-                # If it failed once, it will most probably fail again
+                # If it failed once, it will most probably fail again, unless
+                # the database is explicitely reloaded
                 cls._dbs[dbname] = e
+            else:
+                # The new instance replaces the previous one only once complete,
+                # so concurrent queries are never blocked nor see a partial table
+                cls._dbs[dbname] = db
+                cls.version += 1
+
+    @classmethod
+    def reload(cls, dbname=None):
+        """Instanciate the database again, in order to take new data into account
+
+        If the new instanciation fails, the previous instance is kept.
+
+        Args:
+            dbname: Name of the database to reload
+        Return:
+            object: the new database
+        """
+
+        dbname = cls._dbname(dbname)
+        cls._instanciate(dbname, reload=True)
 
         if isinstance(cls._dbs[dbname], Exception):
             raise EopError("Problem at database instanciation") from cls._dbs[dbname]
 
         return cls._dbs[dbname]
 
+    @classmethod
+    def refresh(cls, dbname=None):
+        """Reload the database if its data changed since its instanciation, or if
+        its instanciation failed.
+
+        A database signals a change of data via an optional ``changed()`` method.
+
+        Args:
+            dbname: Name of the database to refresh
+        Return:
+            bool: ``True`` if the database has been reloaded
+        """
+
+        dbname = cls._dbname(dbname)
+        db = cls._dbs[dbname]
+
+        if isclass(db):
+            # Not instanciated yet, so it will use the latest data
+            return False
+
+        if isinstance(db, Exception) or (hasattr(db, 'changed') and db.changed()):
+            cls.reload(dbname)
+            return True
+
+        return False
+
     @classmethod
     def get(cls, mjd: float, dbname: str = None) -> Eop:
         """Retrieve Earth Orientation Parameters and timescales differences
@@ -267,6 +480,37 @@ class EopDb:
 
         return value
 
+    @classmethod
+    def get_many(cls, mjds, dbname: str = None) -> Eop:
+        """Retrieve Earth Orientation Parameters and timescales differences
+        for an array of dates
+
+        Args:
+            mjds (numpy.ndarray): Dates expressed as Mean Julian Date
+            dbname: Name of the database to use
+        Return:
+            Eop: Object whose attributes are arrays of the same shape as ``mjds``
+        """
+
+        mjds = np.asarray(mjds, dtype=float)
+
+        try:
+            db = cls.db(dbname)
+            if hasattr(db, 'get_many'):
+                return db.get_many(mjds)
+        except (EopError, KeyError):
+            # The missing-value policy is applied below, date by date
+            if cls.policy() == cls.ERROR:
+                raise
+
+        values = [cls.get(mjd, dbname) for mjd in mjds.ravel()]
+
+        fields = {}
+        for name in Eop.FIELDS:
+            fields[name] = np.reshape([float(getattr(x, name)) for x in values], mjds.shape)
+
+        return Eop(**fields)
+
     @classmethod
     def policy(cls):
         pol = config.get("eop", "missing_policy", fallback=cls.MIS_DEFAULT)
@@ -280,7 +524,9 @@ class EopDb:
         """Register an Eop Database
 
         The only requirement of this database is that it should have ``__getitem__``
-        method accepting MJD as float.
+        method accepting MJD as float. Optionally, a ``changed()`` method returning
+        ``True`` when the underlying data has been modified allows :py:meth:`refresh`
+        to reload it.
         """
 
         if name in cls._dbs:
@@ -288,6 +534,7 @@ class EopDb:
             warnings.warn(msg, EopWarning)
         else:
             cls._dbs[name] = klass
+            cls._classes[name] = klass
 
 
 def register(name=EopDb.DEFAULT_DBNAME):
@@ -340,16 +587,44 @@ def register(name=EopDb.DEFAULT_DBNAME):
         return klass
 
 
+class _Interpolation():
+    """Interpolation settings shared by the EOP databases, read from the
+    ``interp`` and ``order`` config variables
+    """
+
+    LINEAR = "linear"
+    LAGRANGE = "lagrange"
+
+    DEFAULT_INTERP = LINEAR
+    DEFAULT_ORDER = 4
+
+    COLUMNS = ('x', 'y', 'dx', 'dy', 'dpsi', 'deps', 'lod', 'ut1_utc')
+    """Names of the columns of data extracted from the finals files"""
+
+    def _load_interp_config(self):
+        self.interp = config.get('eop', 'interp', fallback=self.DEFAULT_INTERP)
+        self.order = config.get('eop', 'order', fallback=self.DEFAULT_ORDER)
+
+        if self.interp not in (self.LINEAR, self.LAGRANGE):
+            raise ConfigError("Unknown config value for 'eop.interp'")
+
+
 @register
-class SimpleEopDatabase():
+class SimpleEopDatabase(_Interpolation):
     """Simple implementation of database
 
-    Uses ``tai-utc.dat``, ``finals.all`` and ``finals2000A.all`` files directly
-    without caching nor interpolation.
+    Uses ``tai-utc.dat``, ``finals.all`` and ``finals2000A.all`` files.
+
+    Unless the ``cache`` config variable is set to ``False``, the parsed content of
+    these files is written in a binary file alongside them (``.eop-cache.<type>.npy``)
+    at the first instanciation. Subsequent instanciations will load this file instead
+    of parsing the text files, as long as their modification times and sizes are
+    unchanged.
 
     In order to use these files, you have to provide the directory containing them as a config
     variable. Optionnally, you can provide the type of data you want to extract from finals files
-    ('all', 'data' or 'daily').
+    ('all', 'data' or 'daily'), and the interpolation method between two daily values
+    (:py:attr:`LINEAR` or :py:attr:`LAGRANGE`, the later using ``order`` points).
 
     .. code-block:: python
 
@@ -357,40 +632,258 @@ class SimpleEopDatabase():
         config.update({
             'eop': {
                 'folder': "/path/to/eop/data/",
-                'type': "all"
+                'type': "all",
+                'interp': "lagrange",
+                'order': 4,
+                'cache': True,
             }
         })
+
+    The values are stored in columns, allowing to retrieve the EOP of a whole
+    array of dates with :py:meth:`get_many`.
+
+    As UT1-UTC is discontinuous at each leap second, the interpolation is done on
+    UT1-TAI, and TAI-UTC is added back at the desired date. The values of the last
+    day of the files are kept for the whole day.
     """
 
     def __init__(self):
         path = Path(config.get('eop', 'folder', fallback=Path.cwd()))
         type = config.get('eop', 'type', fallback="all")
 
-        # Data reading
-        f = Finals(path / ('finals.%s' % type))
-        f2 = Finals2000A(path / ('finals2000A.%s' % type))
-        t = TaiUtc(path / "tai-utc.dat")
+        self._load_interp_config()
+
+        sources = [
+            path / ('finals.%s' % type),
+            path / ('finals2000A.%s' % type),
+            path / "tai-utc.dat"
+        ]
+        cache = path / ('.eop-cache.%s.npy' % type)
+
+        self._sources = sources
+        self._source_signature = signature = self._signature(sources)
+
+        if config.get('eop', 'cache', fallback=True):
+            if not self._load_cache(cache, signature):
+                self._parse(*sources)
+                self._save_cache(cache, signature)
+        else:
+            self._parse(*sources)
+
+    def _parse(self, finals, finals2000a, tai_utc):
+        """Extraction of data from text files
+        """
+
+        f = Finals(finals)
+        f2 = Finals2000A(finals2000a)
+        t = TaiUtc(tai_utc)
+
+        self.leap_seconds = t
 
         # Extracting data from finals files
-        self._finals = {}
-        for date, values in f.items():
-            self._finals[date] = values
-            self._finals[date].update(f2[date])
+        days = sorted(f.data.keys())
+        self._mjd0 = days[0]
+        if days[-1] - days[0] + 1 != len(days):
+            raise EopError("Non-contiguous data in finals files")
+
+        data = np.empty((len(days), len(self.COLUMNS)))
+        for i, date in enumerate(days):
+            values = f[date].copy()
+            values.update(f2[date])
+            data[i] = [values[name] for name in self.COLUMNS]
+
+        # UT1-UTC is interpolated via UT1-TAI in order to avoid discontinuities
+        # at leap seconds
+        data[:, -1] -= t.get_many(days)
+        self._data = data
+
+    CACHE_VERSION = 1
+    """Version of the layout of the binary cache file. Any change in this layout
+    should increment this number, in order to invalidate existing files
+    """
+
+    @classmethod
+    def _signature(cls, sources):
+        """Modification time and size of each source file, in order to detect
+        any change since the creation of the cache
+        """
+        signature = []
+        for source in sources:
+            stat = source.stat()
+            signature.extend([stat.st_mtime, stat.st_size])
+        return signature
+
+    def _load_cache(self, path, signature):
+        """Load the binary cache file, if it is still valid
+
+        The cache is a single 2D float array, of the same width as
+        :py:attr:`COLUMNS`, and organized as follow:
 
-        self._tai_utc = t.data.copy()
+            * first line: version, number of leap seconds, first MJD of the data
+            * second line: signature of the source files
+            * for each leap second, one line with its MJD and the value of TAI-UTC
+            * the data, one line per day
+
+        As it is memory-mapped, the data is read from the disk only when needed.
+
+        Return:
+            bool: ``True`` if the cache was valid and loaded
+        """
+
+        try:
+            cache = np.load(str(path), mmap_mode='r')
+        except (OSError, ValueError):
+            return False
+
+        if cache.ndim != 2 or cache.shape[1] != len(self.COLUMNS) or len(cache) < 2:
+            return False
+
+        version, nb_leaps, mjd0 = cache[0, :3]
+
+        if version != self.CACHE_VERSION or cache[1, :len(signature)].tolist() != signature:
+            return False
+
+        nb_leaps = int(nb_leaps)
+        self._mjd0 = int(mjd0)
+        self.leap_seconds = LeapSeconds(zip(
+            cache[2:2 + nb_leaps, 0].astype(int).tolist(),
+            cache[2:2 + nb_leaps, 1].tolist()
+        ))
+        self._data = cache[2 + nb_leaps:]
+
+        return True
+
+    def _save_cache(self, path, signature):
+        """Write the binary cache file (see :py:meth:`_load_cache` for its layout)
+
+        Failure to write the file is not an error, as the cache is just a way
+        to accelerate the next instanciations.
+        """
+
+        width = len(self.COLUMNS)
+        leaps = np.array(self.leap_seconds.data, dtype=float).reshape(-1, 2)
+        nb_leaps = len(leaps)
+
+        cache = np.zeros((2 + nb_leaps + len(self._data), width))
+        cache[0, :3] = self.CACHE_VERSION, nb_leaps, self._mjd0
+        cache[1, :len(signature)] = signature
+        cache[2:2 + nb_leaps, :2] = leaps
+        cache[2 + nb_leaps:] = self._data
+
+        # The file is written under a temporary name, then renamed, in order to
+        # never expose a partially written cache to concurrent processes
+        tmp = path.with_name("%s.%d.tmp" % (path.name, os.getpid()))
+        try:
+            with tmp.open('wb') as fp:
+                np.save(fp, cache)
+            os.replace(str(tmp), str(path))
+        except OSError:
+            if tmp.exists():
+                tmp.unlink()
+
+    def changed(self):
+        """Check if the source files have been modified since the instanciation
+
+        Return:
+            bool
+        """
+        try:
+            return self._signature(self._sources) != self._source_signature
+        except OSError:
+            # Files being replaced, or removed. In both cases, the current
+            # data is kept
+            return False
 
     def __getitem__(self, mjd):
-        data = self.finals(mjd)
+        data = dict(zip(self.COLUMNS, self._interp_one(mjd)))
         data["tai_utc"] = self.tai_utc(mjd)
+        data["ut1_utc"] += data["tai_utc"]
 
         return Eop(**data)
 
+    def get_many(self, mjds):
+        """Retrieve the EOP for an array of dates
+
+        Args:
+            mjds (numpy.ndarray): Dates in MJD
+        Return:
+            Eop: object whose attributes are arrays of the same shape as ``mjds``
+        """
+        mjds = np.asarray(mjds, dtype=float)
+        values = self._interp(mjds.ravel())
+
+        data = {
+            name: values[:, i].reshape(mjds.shape)
+            for i, name in enumerate(self.COLUMNS)
+        }
+        data['tai_utc'] = self.leap_seconds.get_many(mjds)
+        data['ut1_utc'] = data['ut1_utc'] + data['tai_utc']
+
+        return Eop(**data)
+
+    @property
+    def _order(self):
+        """Number of points used for the interpolation
+        """
+        return 2 if self.interp == self.LINEAR else min(self.order, len(self._data))
+
+    def _interp_one(self, mjd):
+        """Scalar version of :py:meth:`_interp`, avoiding the overhead of numpy
+        for a single date
+
+        Args:
+            mjd (float):
+        Return:
+            list of float: one element per column
+        """
+
+        pos = mjd - self._mjd0
+
+        if not 0 <= pos < len(self._data):
+            raise KeyError(mjd)
+
+        # The values of the last day are kept for the whole day
+        pos = min(pos, len(self._data) - 1)
+
+        # Only the lines used by the interpolation are read from the table,
+        # which may be memory-mapped
+        order = self._order
+        start = min(max(int(pos) - (order - 1) // 2, 0), len(self._data) - order)
+
+        return _lagrange_one(self._data[start:start + order].tolist(), pos - start, order)
+
+    def _interp(self, mjds):
+        """Interpolation of all the columns at once
+
+        Args:
+            mjds (numpy.ndarray): 1D array of dates
+        Return:
+            numpy.ndarray: 2D array, one line per date, one column per
+            element of :py:attr:`COLUMNS`
+        """
+
+        # Position of each date in the table
+        pos = mjds - self._mjd0
+
+        outside = (pos < 0) | (pos >= len(self._data))
+        if outside.any():
+            raise KeyError(float(mjds[outside][0]))
+
+        # The values of the last day are kept for the whole day
+        pos = np.minimum(pos, len(self._data) - 1)
+
+        return _lagrange(self._data, pos, self._order)
+
     def finals(self, mjd: float):
-        return self._finals[int(mjd)].copy()
+        """Interpolated values extracted from the finals files
+
+        Args:
+            mjd (float): Date in MJD
+        Return:
+            dict:
+        """
+        values = self[mjd]
+        return {name: getattr(values, name) for name in self.COLUMNS}
 
     def tai_utc(self, mjd: float):
-        for date, value in reversed(self._tai_utc):
-            if date <= mjd:
-                return value
-        else:
-            raise KeyError(mjd)
+        return self.leap_seconds[mjd]
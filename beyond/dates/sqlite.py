@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""EOP database stored in a SQLite file
+"""
+
+import sqlite3
+import threading
+import numpy as np
+from math import floor, ceil
+from pathlib import Path
+
+from ..config import config
+from ..errors import EopError
+from .eop import (
+    Eop, Finals, Finals2000A, TaiUtc, LeapSeconds, _Interpolation, _lagrange, _lagrange_one
+)
+
+__all__ = ["SqliteEopDatabase"]
+
+
+class SqliteEopDatabase(_Interpolation):
+    """EOP database stored in an indexed SQLite file, allowing several processes
+    to share the same already-parsed data.
+
+    This database is registered under the name ``sqlite`` via the ``beyond.eopdb``
+    entry point. It is filled and kept up-to-date with :py:meth:`update`, which
+    only writes the days that are new or modified since the last update. Any
+    file of the ``finals`` and ``finals2000A`` families (``all``, ``data`` or
+    ``daily``) can be used.
+
+    .. code-block:: python
+
+        from beyond.config import config
+        config.update({
+            'eop': {
+                'dbname': "sqlite",
+                'sqlite': "/path/to/eop.sqlite",
+                'interp': "lagrange",
+                'order': 4,
+            }
+        })
+
+        EopDb.db().update(
+            "/path/to/finals.daily",
+            "/path/to/finals2000A.daily",
+            "/path/to/tai-utc.dat"
+        )
+
+    If the ``sqlite`` config variable is not set, the file ``eop.sqlite`` in the
+    ``folder`` config variable is used.
+
+    Queries on arrays of dates are done with a single range request on the
+    database, and interpolated the same way as :py:class:`~beyond.dates.eop.SimpleEopDatabase`.
+    """
+
+    def __init__(self, path=None):
+
+        if path is None:
+            folder = Path(config.get('eop', 'folder', fallback=Path.cwd()))
+            path = config.get('eop', 'sqlite', fallback=folder / "eop.sqlite")
+
+        self.path = Path(path)
+        self._load_interp_config()
+
+        # A single connection is shared by all threads, as PRAGMA data_version
+        # is only meaningful within a connection. Its accesses are serialized
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.RLock()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS finals (mjd INTEGER PRIMARY KEY, %s)"
+                % ", ".join("%s REAL" % name for name in self.COLUMNS)
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tai_utc (mjd INTEGER PRIMARY KEY, value REAL)"
+            )
+
+        self._load_leap_seconds()
+        self._data_version = self._get_data_version()
+        self._updated = False
+
+    def _get_data_version(self):
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def changed(self):
+        """Check if the database has been modified since the instanciation, either
+        by :py:meth:`update` or by another process
+
+        Return:
+            bool
+        """
+        return self._updated or self._get_data_version() != self._data_version
+
+    def _load_leap_seconds(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT mjd, value FROM tai_utc").fetchall()
+        self.leap_seconds = LeapSeconds(rows)
+
+    def _upsert(self, table, rows):
+        """Insert or replace the rows that differ from the content of the table
+
+        Args:
+            table (str): Name of the table
+            rows (dict): Values of each row, indexed by MJD
+        Return:
+            int: Number of rows written
+        """
+
+        if not rows:
+            return 0
+
+        existing = {
+            row[0]: row[1:] for row in self._conn.execute(
+                "SELECT * FROM %s WHERE mjd BETWEEN ? AND ?" % table,
+                (min(rows), max(rows))
+            )
+        }
+
+        changed = [
+            (mjd,) + values
+            for mjd, values in sorted(rows.items())
+            if existing.get(mjd) != values
+        ]
+
+        if changed:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO %s VALUES (%s)" % (table, ", ".join("?" * len(changed[0]))),
+                changed
+            )
+
+        return len(changed)
+
+    def update(self, finals, finals2000a, tai_utc=None):
+        """Ingest the content of EOP files in the database
+
+        Only the days present in both finals files are taken into account.
+
+        Args:
+            finals (str or Path): Path to a ``finals`` file
+            finals2000a (str or Path): Path to a ``finals2000A`` file
+            tai_utc (str or Path): Path to a ``tai-utc.dat`` file
+        Return:
+            int: Number of rows inserted or modified
+        """
+
+        f = Finals(finals)
+        f2 = Finals2000A(finals2000a)
+
+        rows = {}
+        for mjd in f.data.keys() & f2.data.keys():
+            values = f[mjd].copy()
+            values.update(f2[mjd])
+            rows[mjd] = tuple(values[name] for name in self.COLUMNS)
+
+        with self._lock, self._conn:
+            count = self._upsert("finals", rows)
+
+            if tai_utc is not None:
+                count += self._upsert("tai_utc", {
+                    mjd: (value,) for mjd, value in TaiUtc(tai_utc).data
+                })
+
+        self._load_leap_seconds()
+        self._updated = self._updated or count > 0
+
+        return count
+
+    @property
+    def _order(self):
+        """Number of points used for the interpolation
+        """
+        return 2 if self.interp == self.LINEAR else self.order
+
+    def _table(self, start, stop):
+        """Retrieve the data for a range of days
+
+        UT1-UTC is converted to UT1-TAI, in order to avoid discontinuities at
+        leap seconds during the interpolation.
+
+        Args:
+            start (int): First day (included)
+            stop (int): Last day (included)
+        Return:
+            tuple: MJD of the first row and list of rows
+        """
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM finals WHERE mjd BETWEEN ? AND ? ORDER BY mjd", (start, stop)
+            ).fetchall()
+
+        if not rows:
+            raise KeyError(start)
+
+        mjd0 = rows[0][0]
+        if rows[-1][0] - mjd0 + 1 != len(rows):
+            raise EopError("Non-contiguous data in database")
+
+        rows = [
+            list(row[1:-1]) + [row[-1] - self.leap_seconds[row[0]]]
+            for row in rows
+        ]
+
+        return mjd0, rows
+
+    def __getitem__(self, mjd):
+
+        order = self._order
+        mjd0, rows = self._table(floor(mjd) - order, ceil(mjd) + order)
+
+        pos = mjd - mjd0
+        if not 0 <= pos < len(rows):
+            raise KeyError(mjd)
+
+        # The values of the last day are kept for the whole day
+        pos = min(pos, len(rows) - 1)
+
+        data = dict(zip(self.COLUMNS, _lagrange_one(rows, pos, min(order, len(rows)))))
+        data["tai_utc"] = self.leap_seconds[mjd]
+        data["ut1_utc"] += data["tai_utc"]
+
+        return Eop(**data)
+
+    def get_many(self, mjds):
+        """Retrieve the EOP for an array of dates
+
+        Args:
+            mjds (numpy.ndarray): Dates in MJD
+        Return:
+            Eop: object whose attributes are arrays of the same shape as ``mjds``
+        """
+
+        mjds = np.asarray(mjds, dtype=float)
+        flat = mjds.ravel()
+
+        order = self._order
+        mjd0, rows = self._table(floor(flat.min()) - order, ceil(flat.max()) + order)
+
+        pos = flat - mjd0
+        outside = (pos < 0) | (pos >= len(rows))
+        if outside.any():
+            raise KeyError(float(flat[outside][0]))
+
+        # The values of the last day are kept for the whole day
+        pos = np.minimum(pos, len(rows) - 1)
+
+        values = _lagrange(np.array(rows), pos, min(order, len(rows)))
+
+        data = {
+            name: values[:, i].reshape(mjds.shape)
+            for i, name in enumerate(self.COLUMNS)
+        }
+        data['tai_utc'] = self.leap_seconds.get_many(mjds)
+        data['ut1_utc'] = data['ut1_utc'] + data['tai_utc']
+
+        return Eop(**data)
@@ -24,11 +24,11 @@ The relations may be circular, thanks to the use of the Node class.
     ,----.           ,---.         ,----.
     |TEME|--Equinox--|TOD|         |CIRF|
     `----'           `---'         `----'
-                       |              |
-                 Sideral time   Sideral time
-                       |              |
-                     ,---.         ,----.
-                     |PEF|         |TIRF|
+       |               |              |
+       |         Sideral time   Sideral time
+       |               |              |
+     Mean            ,---.         ,----.
+     sideral time----|PEF|         |TIRF|
                      `---'         `----'
                         \\            /
                     IAU 1980       IAU 2010
@@ -46,16 +46,21 @@ import numpy as np
 
 from ..errors import UnknownFrameError
 from ..constants import Earth
-from ..utils.matrix import rot3
+from ..dates.eop import Eop
+from ..dates.date import DateArray
+from ..utils.cache import LruCache
+from ..utils.matrix import rot3, skew
 from ..utils.node import Node
 from . import iau1980, iau2010
+from .grid import settings
+from .precision import get_tier
 from .local import to_qsw, to_tnw
 
 CIO = ['ITRF', 'TIRF', 'CIRF', 'GCRF']
 IAU1980 = ['TOD', 'MOD']
 OTHER = ['EME2000', 'TEME', 'WGS84', 'PEF']
 
-__all__ = CIO + IAU1980 + OTHER + ['get_frame']
+__all__ = CIO + IAU1980 + OTHER + ['get_frame', 'get_transform', 'transform_many']
 
 
 class FrameCache(dict):
@@ -77,6 +82,15 @@ by the developper.
 
 sys.modules[__name__ + ".dynamic"] = dynamic
 
+transform_cache = LruCache(maxsize=1024)
+"""Cache of the transformations between two frames at a given date (see
+:py:class:`Transform`). Its size can be modified via the ``maxsize`` attribute
+and its statistics retrieved via the ``info()`` method.
+"""
+
+_plans = {}
+"""Cache of compiled transformations between two frames, see :py:func:`get_transform`"""
+
 
 def get_frame(frame):
     """Frame factory
@@ -102,12 +116,23 @@ class _MetaFrame(type, Node):
 
         if cls.__name__ in dynamic:
             warnings.warn("A frame with the name '%s' is already registered. Overriding" % cls.__name__)
+            _plans.clear()
+            transform_cache.clear()
 
         cls.__module__ = __name__ + ".dynamic"
 
         # Making the frame available to the get_frame function
         dynamic[cls.__name__] = cls
 
+    def __add__(cls, other):
+        # A link between two frames of the same graph may modify the routes
+        # between them. A link to a new frame (e.g. a station), or between two
+        # separate graphs, leaves the existing routes unchanged
+        if cls._graph is other._graph:
+            _plans.clear()
+            transform_cache.clear()
+        return super().__add__(other)
+
     def __repr__(cls):  # pragma: no cover
         return "<Frame '{}'>".format(cls.name)
 
@@ -118,6 +143,13 @@ class Frame(metaclass=_MetaFrame):
 
     center = Earth
 
+    _eop_dependent = False
+    """Set to ``True`` if the ``_to_X`` methods of the frame use EOP"""
+
+    _vectorized = True
+    """Set to ``False`` if the ``_to_X`` methods of the frame can't handle
+    a :py:class:`~beyond.dates.date.DateArray`"""
+
     def __init__(self, date, orbit):
         """
         Args:
@@ -135,52 +167,265 @@ class Frame(metaclass=_MetaFrame):
 
     @classmethod
     def _convert(cls, x=None, y=None):
-        m = np.identity(6)
+        shape = np.shape(x if x is not None else y)[:-2]
+        m = np.identity(6) if not shape else np.tile(np.identity(6), shape + (1, 1))
 
         if x is not None:
-            m[:3, :3] = x
+            m[..., :3, :3] = x
         if y is not None:
-            m[3:, 3:] = y
+            m[..., 3:, 3:] = y
 
         return m
 
+    @classmethod
+    def _rate(cls, m, rate):
+        """Transformation matrix from a frame rotating at a given angular velocity,
+        relative to the destination frame.
+
+        The velocity is corrected by the cross product of the rate and the position,
+        which is a linear operation, and as such can be included in the matrix.
+
+        Args:
+            m (numpy.ndarray): 3x3 rotation matrix
+            rate (numpy.ndarray): Angular velocity vector of the rotating frame
+        Return:
+            numpy.ndarray: 6x6 matrix
+        """
+        m6 = cls._convert(m, m)
+        m6[..., 3:, :3] = m @ skew(rate)
+        return m6
+
+    @classmethod
+    def _inverse(cls, m):
+        """Inverse of a 6x6 transformation matrix, composed of rotations on the
+        diagonal and, optionally, a lower-left block accounting for the
+        rotation of one frame relative to the other (see :py:meth:`_rate`)
+        """
+        inv = np.zeros(m.shape)
+        inv[..., :3, :3] = np.swapaxes(m[..., :3, :3], -1, -2)
+        inv[..., 3:, 3:] = np.swapaxes(m[..., 3:, 3:], -1, -2)
+        inv[..., 3:, :3] = - inv[..., 3:, 3:] @ m[..., 3:, :3] @ inv[..., :3, :3]
+        return inv
+
     def transform(self, new_frame):
         """Change the frame of the orbit
 
+        See :py:func:`get_transform`.
+
         Args:
             new_frame (str)
         Return:
             numpy.ndarray
         """
+        return get_transform(self.__class__, new_frame)(self.date, self.orbit)
 
-        steps = self.__class__.steps(new_frame)
 
-        orbit = self.orbit
+class Transform:
+    """Compiled transformation between two frames, as returned by :py:func:`get_transform`
 
-        for _from, _to in steps:
+    The route between the two frames, the method implementing each step and the
+    direction in which it should be applied are resolved once and for all at
+    the creation of the object, which may then be applied to any number of states.
 
-            from_obj = _from(self.date, orbit)
-            direct = "_to_%s" % _to
+    The transformation at a given :py:class:`~beyond.dates.date.Date`, composed
+    of all the individual steps, is kept in :py:data:`transform_cache` and reused
+    for any other state at the same date. This implies that the steps may only
+    depend on the date.
+
+    Example:
 
-            if hasattr(from_obj, direct):
-                rotation, offset = getattr(from_obj, direct)()
+        .. code-block:: python
+
+            itrf2gcrf = get_transform("ITRF", "GCRF")
+            gcrf_state = itrf2gcrf(date, itrf_state)
+            gcrf_states = itrf2gcrf(dates, itrf_states)  # dates as a DateArray
+    """
+
+    def __init__(self, from_frame, to_frame):
+
+        self.from_frame = from_frame
+        """Frame of the states to transform"""
+
+        self.to_frame = to_frame
+        """Frame of the transformed states"""
+
+        self.kernels = []
+        """List of the steps of the transformation, each as a tuple (frame owning
+        the method, the method itself, inversion of the transformation,
+        rotation applied before the translation)"""
+
+        self.needs_eop = False
+        """True if any of the steps uses Earth Orientation Parameters"""
+
+        self.vectorized = True
+        """True if all the steps handle arrays of dates"""
+
+        for _from, _to in from_frame.steps(to_frame.name):
+            direct = "_to_%s" % _to
+            inverse = "_to_%s" % _from
+            if hasattr(_from, direct):
+                owner, method, inv = _from, getattr(_from, direct), False
+            elif hasattr(_to, inverse):
+                owner, method, inv = _to, getattr(_to, inverse), True
             else:
-                to_obj = _to(self.date, orbit)
-                inverse = "_to_%s" % _from
-                if hasattr(to_obj, inverse):
-                    rotation, offset = getattr(to_obj, inverse)()
-                    rotation = rotation.T
-                    offset = - offset
-                else:
-                    raise NotImplementedError("Unknown transformation {} to {}".format(_from, _to))
-
-            if getattr(_from, "_rotation_before_translation", False):
-                # In case of topocentric frame, the rotation is done before the translation
-                orbit = offset + (rotation @ orbit)
+                raise NotImplementedError("Unknown transformation {} to {}".format(_from, _to))
+
+            # In case of topocentric frame, the rotation is done before the translation
+            rotation_first = getattr(_from, "_rotation_before_translation", False)
+
+            self.kernels.append((owner, method, inv, rotation_first))
+            self.needs_eop |= owner._eop_dependent
+            self.vectorized &= owner._vectorized
+
+    def __repr__(self):  # pragma: no cover
+        return "<Transform '{}' to '{}'>".format(self.from_frame.name, self.to_frame.name)
+
+    def _compose(self, date):
+        """Compute all the steps of the transformation, and compose them in
+        a single affine transformation
+
+        If the date is a :py:class:`~beyond.dates.date.DateArray`, the result is
+        a stack of transformations, one per date.
+        """
+
+        matrix, translation = np.identity(6), np.zeros(6)
+
+        for owner, method, inv, rotation_first in self.kernels:
+
+            rotation, offset = method(owner(date, None))
+
+            if inv:
+                rotation = Frame._inverse(rotation)
+                offset = - offset
+
+            if rotation_first:
+                # orbit = offset + rotation @ orbit
+                translation = np.einsum('...ij,...j->...i', rotation, translation) + offset
             else:
-                orbit = rotation @ (offset + orbit)
+                # orbit = rotation @ (offset + orbit)
+                translation = np.einsum('...ij,...j->...i', rotation, translation + offset)
+
+            matrix = rotation @ matrix
+
+        return matrix, translation
+
+    def matrix(self, date):
+        """Affine transformation at a given date
+
+        Args:
+            date (Date or DateArray):
+        Return:
+            tuple: 6x6 matrix and translation vector, such that the transformed
+            state is ``matrix @ state + translation``. For a
+            :py:class:`~beyond.dates.date.DateArray` of N dates, stacks of shape
+            (N, 6, 6) and (N, 6).
+
+        For a single date, the arrays are shared with the cache and read-only.
+
+        Transformations which cannot handle arrays of dates (e.g. to or from
+        frames created with :py:func:`orbit2frame`) raise
+        :py:exc:`NotImplementedError` when called with a DateArray.
+        """
+
+        if isinstance(date, DateArray):
+            if not self.vectorized:
+                raise NotImplementedError(
+                    "Transformation from '{}' to '{}' does not handle arrays of dates".format(
+                        self.from_frame.name, self.to_frame.name
+                    )
+                )
+            # Stacks of transformations are not cached
+            return self._compose(date)
+
+        key = (
+            date._d, date._s, self.from_frame.name, self.to_frame.name, get_tier().name,
+            settings(),
+        )
+        if self.needs_eop:
+            # The same date may be associated with different values of EOP
+            # (e.g. after a reload of the database)
+            eop = date.eop
+            key += tuple(getattr(eop, name) for name in Eop.FIELDS)
+
+        value = transform_cache.get(key)
+        if value is None:
+            value = self._compose(date)
+            # Shared by all the callers, hence read-only
+            for array in value:
+                array.setflags(write=False)
+            transform_cache[key] = value
+
+        return value
+
+    def __call__(self, date, state):
+        """Apply the transformation
+
+        Args:
+            date (Date or DateArray):
+            state (numpy.ndarray): Cartesian state of shape (6,), or (N, 6) if
+                ``date`` is a DateArray of N dates
+        Return:
+            numpy.ndarray: Transformed state(s)
+        """
+
+        matrix, translation = self.matrix(date)
+
+        if isinstance(date, DateArray):
+            return np.einsum('nij,nj->ni', matrix, np.asarray(state)) + translation
+
+        return matrix @ state + translation
+
+
+def get_transform(from_frame, to_frame):
+    """Compiled transformation between two frames
+
+    Transformations are compiled once per couple of frames, and reused until
+    the graph of frames is modified.
 
-        return orbit
+    Args:
+        from_frame (str or Frame): Frame of the states to transform
+        to_frame (str or Frame): Desired frame
+    Return:
+        Transform:
+    """
+
+    if isinstance(from_frame, str):
+        from_frame = get_frame(from_frame)
+
+    if isinstance(to_frame, str):
+        to_frame = get_frame(to_frame)
+
+    key = (from_frame.name, to_frame.name)
+
+    if key not in _plans:
+        _plans[key] = Transform(from_frame, to_frame)
+
+    return _plans[key]
+
+
+def transform_many(dates, states, from_frame, to_frame):
+    """Change the frame of a whole set of states at once
+
+    The models of each step of the transformation are evaluated for all the
+    dates at the same time, and the resulting stack of transformations is applied
+    in a single operation.
+
+    Args:
+        dates (DateArray or list of Date): N dates
+        states (numpy.ndarray): Array of shape (N, 6) of cartesian states
+        from_frame (str or Frame): Frame of the states
+        to_frame (str or Frame): Desired frame
+    Return:
+        numpy.ndarray: Array of shape (N, 6)
+
+    Frames whose transformation cannot handle arrays of dates (e.g. frames created
+    with :py:func:`orbit2frame`) raise :py:exc:`NotImplementedError`.
+    """
+
+    if not isinstance(dates, DateArray):
+        dates = DateArray(dates)
+
+    return get_transform(from_frame, to_frame)(dates, states)
 
 
 class TEME(Frame):
@@ -213,11 +458,18 @@ class PEF(Frame):
 
     orientation = "PEF"
 
+    _eop_dependent = True
+
     def _to_TOD(self):
         m = iau1980.sideral(self.date, model='apparent', eop_correction=False)
-        offset = np.zeros(6)
-        offset[3:] = np.cross(iau1980.rate(self.date), self.orbit[:3])
-        return self._convert(m, m), offset
+        return self._rate(m, iau1980.rate(self.date)), np.zeros(6)
+
+    def _to_TEME(self):
+        # Direct link with TEME through the mean sideral time, as recommended by
+        # Vallado for SGP4 outputs. This avoids the evaluation of the full nutation
+        # model required by the path through TOD.
+        m = iau1980.sideral(self.date, model='mean', eop_correction=False)
+        return self._rate(m, iau1980.rate(self.date)), np.zeros(6)
 
 
 class TOD(Frame):
@@ -250,6 +502,7 @@ class ITRF(Frame):
     """International Terrestrial Reference Frame"""
 
     orientation = "ITRF"
+    _eop_dependent = True
 
     def _to_PEF(self):
         m = iau1980.earth_orientation(self.date)
@@ -265,17 +518,18 @@ class TIRF(Frame):
 
     orientation = "TIRF"
 
+    _eop_dependent = True
+
     def _to_CIRF(self):
         m = iau2010.sideral(self.date)
-        offset = np.zeros(6)
-        offset[3:] = np.cross(iau2010.rate(self.date), self.orbit[:3])
-        return self._convert(m, m), offset
+        return self._rate(m, iau2010.rate(self.date)), np.zeros(6)
 
 
 class CIRF(Frame):
     """Celestial Intermediate Reference Frame"""
 
     orientation = "CIRF"
+    _eop_dependent = True
 
     def _to_GCRF(self):
         m = iau2010.precesion_nutation(self.date)
@@ -342,7 +596,8 @@ def orbit2frame(name, ref_orbit, orientation=None, center=None):
     dct = {
         mtd: _to_parent_frame,
         "orientation": orientation,
-        "center": center
+        "center": center,
+        "_vectorized": False,
     }
 
     # Creation of the class
@@ -355,5 +610,6 @@ def orbit2frame(name, ref_orbit, orientation=None, center=None):
 
 WGS84 + ITRF + PEF + TOD + MOD + EME2000
 TOD + TEME
+PEF + TEME
 # EME2000 + GCRF
 ITRF + TIRF + CIRF + GCRF
@@ -0,0 +1,200 @@
+"""Tabulation of smooth Earth orientation quantities
+
+The evaluation of the nutation series (see :py:mod:`~beyond.frames.iau1980`
+and :py:mod:`~beyond.frames.iau2010`) is the costliest part of frame
+conversions. For long computations, these quantities may be tabulated on a
+regular grid of TT dates and interpolated by Lagrange polynomials, as
+suggested by the IERS Conventions (2010, §5.5.4) for the coordinates of the CIP.
+
+This behaviour is activated by the :ref:`grid <frames-grid>` configuration
+variable.
+
+.. code-block:: python
+
+    from beyond.config import config
+
+    config.update({
+        'frames': {
+            'grid': {
+                'step': 3600,  # seconds
+            }
+        }
+    })
+
+The grid is built lazily, window by window, and shared by all the frame
+conversions of the process. Each window is checked against the model at the
+middle of each of its intervals, where the interpolation error is the largest.
+If this error exceeds the tolerance, the window is discarded and the model is
+evaluated directly for all the dates it contains.
+"""
+
+import numpy as np
+
+from ..config import config
+from ..dates.date import DateArray
+from ..dates.eop import _lagrange, _lagrange_one
+from ..utils.cache import LruCache
+from ..utils.memoize import memoize
+
+__all__ = ['Grid', 'settings', 'tabulated']
+
+
+class Grid:
+    """Tabulation of a function of the date on a regular grid of TT dates
+
+    Args:
+        func (callable): Function to tabulate, taking a
+            :py:class:`~beyond.dates.date.DateArray` as first argument and
+            returning a tuple of arrays
+        args (tuple): Additional arguments of ``func``
+        step (float): Interval between two nodes of the grid, in seconds
+        order (int): Number of nodes used for the interpolation
+        window (float): Width of the windows of the grid, in days
+        tolerance (float): Maximum interpolation error, in the unit of the
+            values returned by ``func``
+    """
+
+    def __init__(self, func, args=(), step=3600., order=8, window=7., tolerance=1e-6):
+        self.func = func
+        self.args = args
+        self.step = float(step)
+        self.order = order
+        self.size = max(int(window * 86400. // self.step), 1)
+        self.tolerance = tolerance
+        self.windows = LruCache(maxsize=64)
+
+    def _nodes(self, first, count):
+        """Dates of consecutive nodes of the grid
+
+        Args:
+            first (int): Index of the first node
+            count (int): Number of nodes
+        Return:
+            DateArray:
+        """
+        d, s = np.divmod((first + np.arange(count)) * self.step, 86400.)
+        return DateArray(d.astype(int), s, scale="TT")
+
+    def _window(self, index):
+        """Retrieve a window of the grid, and build it if necessary
+
+        Args:
+            index (int): Index of the window
+        Return:
+            numpy.ndarray: 2D table of values, one line per node, or ``None``
+            if the tolerance could not be met
+        """
+
+        table = self.windows.get(index, False)
+        if table is not False:
+            return table
+
+        # The window is extended on both sides, in order to keep the
+        # interpolation centered up to its boundaries
+        first = index * self.size - self.order
+        count = self.size + 2 * self.order
+        table = np.array(self.func(self._nodes(first, count), *self.args)).T
+
+        # Comparison between the model and the interpolation at the
+        # middle of each interval of the window
+        pos = np.arange(self.size) + self.order + 0.5
+        ref = np.array(self.func(self._nodes(first + 0.5 + self.order, self.size), *self.args)).T
+        error = np.abs(_lagrange(table, pos, self.order) - ref).max()
+
+        if error > self.tolerance:
+            table = None
+
+        self.windows[index] = table
+        return table
+
+    def __call__(self, date):
+        """Interpolated values of the function
+
+        Args:
+            date (Date or DateArray)
+        Return:
+            tuple: Same as the tabulated function
+        """
+
+        # Position of the dates in the grid
+        tt = date.change_scale('TT')
+        pos = (tt.d * 86400. + tt.s) / self.step
+
+        if not isinstance(date, DateArray):
+            index = int(pos // self.size)
+            table = self._window(index)
+            if table is None:
+                return self.func(date, *self.args)
+            return tuple(_lagrange_one(table, pos - index * self.size + self.order, self.order))
+
+        indices = np.floor(pos).astype(int) // self.size
+
+        values = None
+        for index in np.unique(indices):
+            mask = indices == index
+            table = self._window(index)
+
+            if table is not None:
+                value = _lagrange(table, pos[mask] - index * self.size + self.order, self.order).T
+            else:
+                value = np.array(self.func(date[mask], *self.args))
+
+            if values is None:
+                values = np.empty((len(value),) + pos.shape)
+            values[:, mask] = value
+
+        return tuple(values)
+
+
+@memoize
+def _grid(func, args, step, order, window, tolerance):
+    return Grid(func, args, step, order, window, tolerance)
+
+
+def settings():
+    """Effective parameters of the grid, as set by the :ref:`grid <frames-grid>`
+    configuration variable
+
+    Caches of values derived from :py:func:`tabulated` should include them in
+    their keys, so that a change of configuration is taken into account.
+
+    Return:
+        tuple: step, order, window and tolerance, or ``None`` if the grid
+        is disabled
+    """
+
+    step = config.get('frames', 'grid', 'step', fallback=None)
+
+    if not step:
+        return None
+
+    return (
+        step,
+        config.get('frames', 'grid', 'order', fallback=8),
+        config.get('frames', 'grid', 'window', fallback=7.),
+        config.get('frames', 'grid', 'tolerance', fallback=1e-6),
+    )
+
+
+def tabulated(func, date, *args, unit=1.):
+    """Evaluate a function of the date through its grid, if enabled by the
+    :ref:`grid <frames-grid>` configuration variable, and directly otherwise
+
+    Args:
+        func (callable): Function of the date, returning a tuple
+        date (Date or DateArray)
+        args: Additional arguments of ``func``
+        unit (float): Value of one unit of the results of ``func``, in arcsecond
+    Return:
+        tuple: Same as ``func``
+    """
+
+    params = settings()
+
+    if params is None:
+        return func(date, *args)
+
+    step, order, window, tolerance = params
+    grid = _grid(func, args, step, order, window, tolerance / unit)
+
+    return grid(date)
@@ -9,37 +9,70 @@ import numpy as np
 
 from ..utils.matrix import rot1, rot2, rot3
 from ..utils.memoize import memoize
+from ..dates.eop import EopDb
+from ..dates.date import DateArray
+from .grid import settings, tabulated
+from .precision import get_tier
 
 
 @memoize
-def _tab(max_i=None):
+def _tab():
     """Extraction and caching of IAU1980 nutation coefficients
+
+    Return:
+        tuple: 2D array of the multipliers of the fundamental arguments (integers)
+        and 2D array of the A, A', B, B' coefficients (floats, in 0.1 mas),
+        one line per term
     """
 
     filepath = Path(__file__).parent / "data" / "tab5.1.txt"
 
-    result = []
+    integers, reals = [], []
     with filepath.open() as fhd:
-        i = 0
         for line in fhd.read().splitlines():
             if line.startswith("#") or not line.strip():
                 continue
 
             fields = line.split()
-            result.append(([int(x) for x in fields[:5]], [float(x) for x in fields[6:]]))
+            integers.append([int(x) for x in fields[:5]])
+            reals.append([float(x) for x in fields[6:]])
+
+    return np.array(integers), np.array(reals)
+
+
+@memoize
+def _terms(truncation):
+    """Number of terms of the series necessary to meet a truncation budget
+
+    The terms being sorted by decreasing amplitude, the last ones are removed
+    as long as the sum of their amplitudes remains below the budget, for both
+    Δψ and Δε.
 
-            i += 1
-            if max_i and i >= max_i:
-                break
+    Args:
+        truncation (float): Maximum sum of the amplitudes of the terms neglected,
+            in arcsecond
+    Return:
+        int
+    """
 
-    return result
+    _, reals = _tab()
+    A, B, C, D = np.abs(reals.T)
+
+    # Conversion of the budget from arcsecond to 0.1 mas
+    truncation *= 10000.
+    neglected = (np.cumsum((A + B)[::-1]) <= truncation) & (np.cumsum((C + D)[::-1]) <= truncation)
+
+    return len(reals) - int(neglected.sum())
 
 
 def rate(date):
     """Return the rotation rate vector of the earth for a given date
+
+    For a :py:class:`~beyond.dates.date.DateArray`, the result is of shape (N, 3)
     """
     lod = date.eop.lod / 1000.
-    return np.array([0, 0, 7.292115146706979e-5 * (1 - lod / 86400.)])
+    w = 7.292115146706979e-5 * (1 - lod / 86400.)
+    return np.stack([np.zeros_like(w), np.zeros_like(w), w], axis=-1)
 
 
 def _earth_orientation(date):
@@ -76,15 +109,16 @@ def precesion(date):  # pragma: no cover
     return rot3(zeta) @ rot2(-theta) @ rot3(z)
 
 
-@memoize
-def _nutation(date, eop_correction=True, terms=106):
+def _nutation(date, eop_correction=True, terms=None):
     """Model 1980 of nutation as described in Vallado p. 224
 
     Args:
-        date (beyond.utils.date.Date)
+        date (beyond.utils.date.Date or beyond.dates.date.DateArray)
         eop_correction (bool): set to ``True`` to include model correction
-            from 'finals' files.
-        terms (int)
+            from 'finals' files. Ignored if the precision tier skips them
+            (see :py:mod:`~beyond.frames.precision`)
+        terms (int): Number of terms of the series. If ``None``, depends on
+            the precision tier
     Return:
         tuple : 3-elements, all floats in degrees
             1. ̄ε
@@ -97,6 +131,39 @@ def _nutation(date, eop_correction=True, terms=106):
         by Vallado.
     """
 
+    tier = get_tier()
+    if terms is None:
+        terms = _terms(tier.truncation)
+    eop_correction = eop_correction and tier.eop_correction
+
+    if isinstance(date, DateArray):
+        # Results for arrays of dates are not cached
+        return _nutation_model(date, eop_correction, terms)
+
+    return _nutation_cached(date, eop_correction, terms)
+
+
+def _nutation_model(date, eop_correction, terms):
+
+    epsilon_bar, delta_psi, delta_eps = tabulated(_nutation_series, date, terms, unit=3600.)
+
+    if eop_correction:
+        delta_eps = delta_eps + date.eop.deps / 3600000.
+        delta_psi = delta_psi + date.eop.dpsi / 3600000.
+
+    return epsilon_bar, delta_psi, delta_eps
+
+
+def _nutation_series(date, terms):
+    """Nutation, without model corrections
+
+    Args:
+        date (Date or DateArray)
+        terms (int)
+    Return:
+        tuple : 3-elements, all floats in degrees (see :py:func:`_nutation`)
+    """
+
     ttt = date.change_scale('TT').julian_century
 
     r = 360.
@@ -128,25 +195,32 @@ def _nutation(date, eop_correction=True, terms=106):
     om_m = 125.04452222 - (5 * r + 134.1362608) * ttt\
         + 0.0020708 * ttt ** 2 + 2.2e-6 * ttt ** 3
 
-    delta_psi = 0.
-    delta_eps = 0.
-    for integers, reals in _tab(terms):
-        a1, a2, a3, a4, a5 = integers
-        # Conversion from 0.1 mas to mas
-        A, B, C, D = np.array(list(reals)) / 36000000.
-        a_p = a1 * m_m + a2 * m_s + a3 * u_m_m + a4 * d_s + a5 * om_m
-        # a_p %= 360.
-        delta_psi += (A + B * ttt) * np.sin(np.deg2rad(a_p))
-        delta_eps += (C + D * ttt) * np.cos(np.deg2rad(a_p))
+    integers, reals = _tab()
+    integers, reals = integers[:terms], reals[:terms]
 
-    if eop_correction:
-        delta_eps += date.eop.deps / 3600000.
-        delta_psi += date.eop.dpsi / 3600000.
+    # Conversion from 0.1 mas to degrees
+    A, B, C, D = reals.T / 36000000.
+
+    # Arguments of all the terms, for all the dates at once
+    #
+    # ∆ψ = Σ (A + B * ttt) sin(a_p)
+    # ∆ε = Σ (C + D * ttt) cos(a_p)
+    a_p = np.deg2rad(integers @ np.array([m_m, m_s, u_m_m, d_s, om_m]))
+    sin_p, cos_p = np.sin(a_p), np.cos(a_p)
+
+    delta_psi = A @ sin_p + ttt * (B @ sin_p)
+    delta_eps = C @ cos_p + ttt * (D @ cos_p)
 
     return epsilon_bar, delta_psi, delta_eps
 
 
-def nutation(date, eop_correction=True, terms=106):  # pragma: no cover
+# Results depend on the EOP database and, when tabulated, on the grid
+_nutation_cached = memoize(
+    version=lambda: (EopDb.version, settings()), maxsize=1024
+)(_nutation_model)
+
+
+def nutation(date, eop_correction=True, terms=None):  # pragma: no cover
     """Nutation as a rotation matrix
     """
     epsilon_bar, delta_psi, delta_eps = np.deg2rad(_nutation(date, eop_correction, terms))
@@ -155,26 +229,28 @@ def nutation(date, eop_correction=True, terms=106):  # pragma: no cover
     return rot1(-epsilon_bar) @ rot3(delta_psi) @ rot1(epsilon)
 
 
-def equinox(date, eop_correction=True, terms=106, kinematic=True):
+def equinox(date, eop_correction=True, terms=None, kinematic=True):
     """Equinox equation in degrees
     """
     epsilon_bar, delta_psi, delta_eps = _nutation(date, eop_correction, terms)
 
     equin = delta_psi * 3600. * np.cos(np.deg2rad(epsilon_bar))
 
-    if date.d >= 50506 and kinematic:
+    if kinematic:
         # Starting 1992-02-27, we apply the effect of the moon
         ttt = date.change_scale('TT').julian_century
         om_m = 125.04455501 - (5 * 360. + 134.1361851) * ttt\
             + 0.0020756 * ttt ** 2 + 2.139e-6 * ttt ** 3
 
-        equin += 0.00264 * np.sin(np.deg2rad(om_m)) + 6.3e-5 * np.sin(np.deg2rad(2 * om_m))
+        equin += (date.d >= 50506) * (
+            0.00264 * np.sin(np.deg2rad(om_m)) + 6.3e-5 * np.sin(np.deg2rad(2 * om_m))
+        )
 
     # print("esquinox = {}\n".format(equin / 3600))
     return equin / 3600.
 
 
-def _sideral(date, longitude=0., model='mean', eop_correction=True, terms=106):
+def _sideral(date, longitude=0., model='mean', eop_correction=True, terms=None):
     """Get the sideral time at a defined date
 
     Args:
@@ -210,7 +286,7 @@ def _sideral(date, longitude=0., model='mean', eop_correction=True, terms=106):
     return theta
 
 
-def sideral(date, longitude=0., model='mean', eop_correction=True, terms=106):  # pragma: no cover
+def sideral(date, longitude=0., model='mean', eop_correction=True, terms=None):  # pragma: no cover
     """Sideral time as a rotation matrix
     """
     theta = _sideral(date, longitude, model, eop_correction, terms)
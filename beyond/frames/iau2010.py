@@ -5,8 +5,10 @@ from pathlib import Path
 
 import numpy as np
 
-from ..utils.matrix import rot1, rot2, rot3
+from ..utils.matrix import rot1, rot2, rot3, _stack
 from ..utils.memoize import memoize
+from .grid import tabulated
+from .precision import get_tier
 
 __all__ = ['sideral', 'precesion_nutation', 'earth_orientation', 'rate']
 
@@ -14,6 +16,11 @@ __all__ = ['sideral', 'precesion_nutation', 'earth_orientation', 'rate']
 @memoize
 def _tab(element):
     """Extraction and caching of IAU2000 nutation coefficients
+
+    Return:
+        tuple: arrays of the power of t of each term (integers), the
+        amplitudes of the sine and cosine of each term (floats, in micro-arcsecond),
+        and the multipliers of the 14 fundamental arguments for each term (integers)
     """
 
     elements = {
@@ -27,7 +34,7 @@ def _tab(element):
 
     filepath = Path(__file__).parent / "data" / elements[element.lower()]
 
-    total = []
+    powers, amplitudes, multipliers = [], [], []
     with filepath.open() as fhd:
 
         for line in fhd.read().splitlines():
@@ -38,17 +45,64 @@ def _tab(element):
                 continue
 
             if line.startswith('j = '):
-                result = []
-                total.append(result)
+                power = int(line.split()[2])
                 continue
 
             # The first field is only an index
             fields = line.split()[1:]
-            fields[:2] = [float(x) for x in fields[:2]]
-            fields[2:] = [int(x) for x in fields[2:]]
-            result.append(fields)
+            powers.append(power)
+            amplitudes.append([float(x) for x in fields[:2]])
+            multipliers.append([int(x) for x in fields[2:]])
+
+    return np.array(powers), np.array(amplitudes), np.array(multipliers)
+
+
+_POLYNOMIALS = np.array([
+    [-16616.99, 2004191742.88, -427219.05, -198620.54, -46.05, 5.98],
+    [-6950.78, -25381.99, -22407250.99, 1842.28, 1113.06, 0.99],
+    [94.0, 3808.65, -122.68, -72574.11, 27.98, 15.62],
+])
+"""Polynomial part of X, Y and s + XY/2, in micro-arcsecond, by increasing power of t"""
+
+
+@memoize
+def _series(truncation=0.):
+    """Terms of the X, Y and s + XY/2 series, gathered in order to be evaluated
+    by matrix products
+
+    Args:
+        truncation (float): Maximum sum of the amplitudes of the terms neglected
+            in each series, in arcsecond (see :py:mod:`~beyond.frames.precision`)
+    Return:
+        tuple: multipliers of the fundamental arguments for all the terms of the
+        three series (integers of shape (M, 14)), and amplitudes of the sine and cosine of
+        these terms, dispatched by element and by power of t (floats of shape (2, 3, 6, M))
+    """
+
+    tabs = []
+    for element in ('x', 'y', 's'):
+        powers, amp, mult = _tab(element)
+
+        # Removal of the smallest terms, as long as the sum of their amplitudes
+        # remains below the truncation budget. The powers of t are bounded
+        # by one in the range of validity.
+        bound = np.abs(amp).sum(axis=1)
+        order = np.argsort(bound)
+        keep = np.ones(len(bound), dtype=bool)
+        keep[order[np.cumsum(bound[order]) <= truncation * 1e6]] = False
+
+        tabs.append((powers[keep], amp[keep], mult[keep]))
+
+    multipliers = np.concatenate([tab[2] for tab in tabs])
+    amplitudes = np.zeros((2, 3, _POLYNOMIALS.shape[1], len(multipliers)))
+
+    start = 0
+    for i, (powers, amp, _) in enumerate(tabs):
+        idx = np.arange(start, start + len(powers))
+        amplitudes[:, i, powers, idx] = amp.T
+        start += len(powers)
 
-    return total
+    return multipliers, amplitudes
 
 
 def _earth_orientation(date):
@@ -87,9 +141,12 @@ def sideral(date):
 
 def rate(date):
     """Return the rotation rate vector of the earth for a given date
+
+    For a :py:class:`~beyond.dates.date.DateArray`, the result is of shape (N, 3)
     """
     lod = date.eop.lod / 1000.
-    return np.array([0, 0, 7.292115146706979e-5 * (1 - lod / 86400.)])
+    w = 7.292115146706979e-5 * (1 - lod / 86400.)
+    return np.stack([np.zeros_like(w), np.zeros_like(w), w], axis=-1)
 
 
 def _planets(date):
@@ -133,53 +190,47 @@ def _planets(date):
 
 
 def _xysxy2(date):
+    """Values of X, Y, s + XY/2, interpolated if the :ref:`grid <frames-grid>`
+    is enabled (see :py:mod:`~beyond.frames.grid`)
+
+    Args:
+        date (Date or DateArray)
+    Return:
+        3-tuple of float: Values of X, Y, s + XY/2 in arcsecond
+    """
+    return tabulated(_xysxy2_series, date, get_tier().truncation)
+
+
+def _xysxy2_series(date, truncation=0.):
     """Here we deviate from what has been done everywhere else. Instead of taking the formulas
     available in the Vallado, we take those described in the files tab5.2{a,b,d}.txt.
 
     The result should be equivalent, but they are the last iteration of the IAU2000A as of June 2016
 
     Args:
-        date (Date)
+        date (Date or DateArray)
+        truncation (float): see :py:func:`_series`
     Return:
-        3-tuple of float: Values of X, Y, s + XY/2 in arcsecond
+        3-tuple of float: Values of X, Y, s + XY/2 in arcsecond. For a
+        :py:class:`~beyond.dates.date.DateArray`, 3-tuple of arrays
     """
 
     planets = _planets(date)
-    x_tab, y_tab, s_tab = _tab('X'), _tab('Y'), _tab('s')
+    multipliers, amplitudes = _series(truncation)
 
     ttt = date.change_scale('TT').julian_century
 
-    # Units: micro-arcsecond
-    X = -16616.99 + 2004191742.88 * ttt - 427219.05 * ttt ** 2 - 198620.54 * ttt ** 3\
-        - 46.05 * ttt ** 4 + 5.98 * ttt ** 5
-
-    Y = -6950.78 - 25381.99 * ttt - 22407250.99 * ttt ** 2 + 1842.28 * ttt ** 3\
-        + 1113.06 * ttt ** 4 + 0.99 * ttt ** 5
-
-    s_xy2 = 94.0 + 3808.65 * ttt - 122.68 * ttt ** 2 - 72574.11 * ttt ** 3\
-        + 27.98 * ttt ** 4 + 15.62 * ttt ** 5
-
-    for j in range(5):
+    # Arguments of all the terms, for all the dates
+    arg = multipliers @ planets
 
-        _x, _y, _s = 0, 0, 0
-        for i in range(len(x_tab[j])):
-            Axs, Axc, *p_coefs = x_tab[j][i]
-            ax_p = np.dot(p_coefs, planets)
-            _x += Axs * np.sin(ax_p) + Axc * np.cos(ax_p)
+    # Coefficients of each power of t, for each element
+    coefs = np.tensordot(amplitudes[0], np.sin(arg), 1)
+    coefs += np.tensordot(amplitudes[1], np.cos(arg), 1)
+    coefs += _POLYNOMIALS.reshape(_POLYNOMIALS.shape + (1,) * np.ndim(ttt))
 
-        for i in range(len(y_tab[j])):
-            Ays, Ayc, *p_coefs = y_tab[j][i]
-            ay_p = np.dot(p_coefs, planets)
-            _y += Ays * np.sin(ay_p) + Ayc * np.cos(ay_p)
-
-        for i in range(len(s_tab[j])):
-            Ass, Asc, *p_coefs = s_tab[j][i]
-            as_p = np.dot(p_coefs, planets)
-            _s += Ass * np.sin(as_p) + Asc * np.cos(as_p)
-
-        X += _x * ttt ** j
-        Y += _y * ttt ** j
-        s_xy2 += _s * ttt ** j
+    # Units: micro-arcsecond
+    t_powers = np.asarray(ttt)[..., None] ** np.arange(_POLYNOMIALS.shape[1])
+    X, Y, s_xy2 = np.einsum('ej...,...j->e...', coefs, t_powers)
 
     # Conversion to arcsecond
     return X * 1e-6, Y * 1e-6, s_xy2 * 1e-6
@@ -196,8 +247,11 @@ def _xys(date):
 
     X, Y, s_xy2 = _xysxy2(date)
 
-    # convert milli-arcsecond to arcsecond
-    dX, dY = date.eop.dx / 1000., date.eop.dy / 1000.
+    if get_tier().eop_correction:
+        # convert milli-arcsecond to arcsecond
+        dX, dY = date.eop.dx / 1000., date.eop.dy / 1000.
+    else:
+        dX, dY = 0., 0.
 
     # Convert arcsecond to degrees then to radians
     X = np.radians((X + dX) / 3600.)
@@ -216,8 +270,10 @@ def precesion_nutation(date):
     d = np.arctan(np.sqrt((X**2 + Y**2) / (1 - X ** 2 - Y ** 2)))
     a = 1 / (1 + np.cos(d))
 
-    return np.array([
+    rows = [
         [1 - a * X ** 2, -a * X * Y, X],
         [-a * X * Y, 1 - a * Y ** 2, Y],
         [-X, -Y, 1 - a * (X**2 + Y**2)]
-    ]) @ rot3(s)
+    ]
+
+    return (np.array(rows) if np.ndim(X) == 0 else _stack(rows)) @ rot3(s)
@@ -0,0 +1,111 @@
+"""Precision tiers of the Earth orientation models
+
+The nutation series of :py:mod:`~beyond.frames.iau1980` and
+:py:mod:`~beyond.frames.iau2010` may be truncated, and model corrections skipped,
+for applications not requiring the full precision of the models.
+
+The following tiers are available:
+
+=============  ================================  ==================  =============================
+Tier           Nutation series                   Model corrections   Error budget
+=============  ================================  ==================  =============================
+``full``       Complete                          Applied             None
+``standard``   Neglected terms below 1 mas       Applied             1 mas per nutation quantity
+``fast``       Neglected terms below 0.1 arcsec  Skipped             0.1 arcsec per nutation
+                                                                     quantity, plus the model
+                                                                     corrections
+=============  ================================  ==================  =============================
+
+The truncation of the series is done by removing the smallest terms, as long
+as the sum of their amplitudes remains below the budget. This is then a bound
+on the error, valid between 1900 and 2100. The nutation quantities are X, Y and
+s + XY/2 for IAU2010 and Δψ and Δε for IAU1980. The model corrections are
+``dx`` and ``dy`` for IAU2010 and ``dpsi`` and ``deps`` for IAU1980, whose values
+are generally below 1 mas and 0.2 arcsec respectively. Polar motion and UT1 are
+never skipped.
+
+The tier is selected process-wide with the :ref:`precision <frames-precision>`
+configuration variable, or for a block of code with :py:func:`precision`, which
+only affects the thread executing the block.
+
+.. code-block:: python
+
+    from beyond.frames.precision import precision
+
+    with precision("fast"):
+        orb.frame = "ITRF"
+"""
+
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
+from ..config import config
+from ..errors import ConfigError
+
+__all__ = ['Tier', 'TIERS', 'get_tier', 'precision']
+
+Tier = namedtuple('Tier', 'name truncation eop_correction')
+"""Definition of a precision tier
+
+Attributes:
+    name (str):
+    truncation (float): Maximum sum of the amplitudes of the neglected terms of
+        each series, in arcsecond
+    eop_correction (bool): If ``False``, the model corrections are skipped
+"""
+
+TIERS = {
+    'full': Tier('full', 0., True),
+    'standard': Tier('standard', 1e-3, True),
+    'fast': Tier('fast', 0.1, False),
+}
+
+DEFAULT = 'full'
+
+# Tiers selected by precision(), specific to each thread
+_local = threading.local()
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def get_tier(name=None):
+    """Retrieve a precision tier
+
+    Args:
+        name (str): Name of the tier. If ``None``, the tier selected by
+            :py:func:`precision` or the configuration is used
+    Return:
+        Tier:
+    """
+
+    if name is None:
+        stack = _stack()
+        name = stack[-1] if stack else config.get('frames', 'precision', fallback=DEFAULT)
+
+    try:
+        return TIERS[name]
+    except KeyError:
+        raise ConfigError("Unknown precision tier '{}'".format(name))
+
+
+@contextmanager
+def precision(name):
+    """Context manager selecting a precision tier for all the computations
+    it encloses, in the current thread only
+
+    Args:
+        name (str): Name of the tier
+    """
+
+    get_tier(name)
+    stack = _stack()
+    stack.append(name)
+    try:
+        yield
+    finally:
+        stack.pop()
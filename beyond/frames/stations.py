@@ -1,7 +1,9 @@
 import numpy as np
 
-from .frames import Frame, WGS84, _MetaFrame
+from .frames import Frame, WGS84, _MetaFrame, get_transform
 from ..constants import Earth
+from ..dates.date import DateArray
+from ..orbits.forms import SPHE
 from ..utils.matrix import rot2, rot3
 
 
@@ -60,6 +62,72 @@ class TopocentricFrame(Frame):
 
             yield point
 
+    @classmethod
+    def inertial(cls, date, frame):
+        """State and attitude of the station in another frame
+
+        For a single :py:class:`~beyond.dates.date.Date`, the underlying
+        transformation is kept in :py:data:`~beyond.frames.frames.transform_cache`,
+        and shared by all the satellites observed at this date.
+
+        Args:
+            date (Date or DateArray):
+            frame (str or Frame): Frame in which the station is expressed,
+                generally an inertial one
+        Return:
+            tuple: Cartesian state of the station in ``frame`` and 6x6 matrix
+            from ``frame`` to the topocentric frame, such that a state ``x``
+            in ``frame`` is ``matrix @ (x - state)`` in the topocentric frame.
+            For a DateArray of N dates, stacks of shape (N, 6) and (N, 6, 6).
+        """
+        matrix, state = get_transform(cls, frame).matrix(date)
+        # The translation is shared with the cache
+        return state.copy(), Frame._inverse(matrix)
+
+    @classmethod
+    def relative(cls, date, states, frame):
+        """Topocentric states of many satellites at once
+
+        Instead of walking each satellite through all the frames separating it
+        from the station, the station is expressed in the frame of the
+        satellites (see :py:meth:`inertial`), and the topocentric states are
+        obtained with one subtraction and one rotation.
+
+        Args:
+            date (Date or DateArray):
+            states (numpy.ndarray): Cartesian states of K satellites in ``frame``,
+                of shape (K, 6), or (K, N, 6) if ``date`` is a DateArray of N dates
+            frame (str or Frame): Frame of the states
+        Return:
+            numpy.ndarray: Cartesian states in the topocentric frame, of the
+            same shape as ``states``
+        """
+        state, matrix = cls.inertial(date, frame)
+        return np.einsum('...ij,k...j->k...i', matrix, np.asarray(states) - state)
+
+    @classmethod
+    def from_spherical(cls, dates, states, frame="EME2000"):
+        """Conversion of many topocentric spherical states, such as tracking
+        measurements, to cartesian states in another frame
+
+        Args:
+            dates (DateArray or list of Date): N dates
+            states (numpy.ndarray): Array of shape (N, 6) of states in spherical
+                form (r, θ, φ, r_dot, θ_dot, φ_dot), as given by an orbit
+                expressed in the frame of the station. θ is counterclockwise,
+                so an azimuth measured clockwise from North is -θ. Angular
+                rates, if not measured, may be set to 0.
+            frame (str or Frame): Desired frame
+        Return:
+            numpy.ndarray: Array of shape (N, 6) of cartesian states
+        """
+
+        if not isinstance(dates, DateArray):
+            dates = DateArray(dates)
+
+        states = SPHE._spherical_to_cartesian(np.asarray(states, dtype=float).T, None).T
+        return get_transform(cls, frame)(dates, states)
+
     def _to_parent_frame(self, *args, **kwargs):
         """Conversion from Topocentric Frame to parent frame
         """
@@ -94,29 +162,154 @@ class TopocentricFrame(Frame):
             np.sin(lat)
         ])
 
+    @classmethod
+    def _mask_table(cls):
+        """Points of the mask sorted by azimuth in [0, 2π)
+
+        The table is computed once, and again only if the content of the mask
+        changes, either by assignment of a new mask or by modification in place.
+        """
+
+        mask = np.asarray(cls.mask)
+        key = (mask.shape, mask.tobytes())
+
+        compiled = cls.__dict__.get('_mask_compiled')
+        if compiled is None or compiled[0] != key:
+            azims = mask[0] % (2 * np.pi)
+            order = np.argsort(azims)
+            compiled = (key, azims[order], mask[1, order])
+            cls._mask_compiled = compiled
+
+        return compiled[1:]
+
     @classmethod
     def get_mask(cls, azim):
         """Linear interpolation between two points of the mask
+
+        The mask is periodic, the interpolation between its last and first
+        points wraps around azimuth 0.
+
+        Args:
+            azim (float or numpy.ndarray): Azimuth, in radians
+        Return:
+            float or numpy.ndarray: Elevation of the mask, in radians
         """
+        azims, elevs = cls._mask_table()
+        return np.interp(azim, azims, elevs, period=2 * np.pi)
+
+    @classmethod
+    def get_mask_max(cls, start, stop):
+        """Maximum elevation of the mask in a sector of azimuth
+
+        The sector extends counterclockwise from ``start`` to ``stop``.
+
+        Args:
+            start (float or numpy.ndarray): Azimuth of the beginning of the sector, in radians
+            stop (float or numpy.ndarray): Azimuth of the end of the sector, in radians
+        Return:
+            float or numpy.ndarray: Maximum elevation of the mask, in radians
+        """
+
+        azims, elevs = cls._mask_table()
+        start, stop = np.asarray(start, dtype=float), np.asarray(stop, dtype=float)
+
+        # As the mask is linear between its points, its maximum in the sector
+        # is reached at one of these points or at one boundary of the sector
+        width = (stop - start) % (2 * np.pi)
+        inside = (azims - start[..., None]) % (2 * np.pi) <= width[..., None]
+        peak = np.where(inside, elevs, -np.inf).max(axis=-1)
+
+        return np.maximum(peak, np.maximum(cls.get_mask(start), cls.get_mask(stop)))
+
+
+class StationNetwork:
+    """Set of ground stations, allowing to compute the geometry of many
+    satellites as seen from all the stations at once
+
+    The conversion of the states to the parent frame of the stations (e.g. from
+    an inertial frame to ITRF) is done once per date for all the satellites, and
+    the rotations of each station are applied to all the dates and satellites
+    at once.
+
+    Args:
+        stations (list of TopocentricFrame): Stations as created by
+            :py:func:`create_station`, all sharing the same parent frame
+
+    Example:
+
+        .. code-block:: python
+
+            network = StationNetwork([create_station(name, latlonalt) for name, latlonalt in sites])
+            azim, elev, rng, rng_rate = network.geometry(dates, states, "TEME")
+    """
+
+    def __init__(self, stations):
+
+        self.stations = list(stations)
+
+        if not self.stations:
+            raise ValueError("No station provided")
+
+        if len({station.parent_frame for station in self.stations}) > 1:
+            raise ValueError("All the stations of a network should share the same parent frame")
+
+        self.parent_frame = self.stations[0].parent_frame
+
+        # Rotations from the parent frame to each topocentric frame (M, 3, 3)
+        # and positions of the stations in these frames (M, 3).
+        # All the frames are oriented towards North (heading of π), whatever
+        # the orientation of the stations, so azimuths share the same reference
+        self.rotations = np.array([
+            (rot3(-lon) @ rot2(lat - np.pi / 2.) @ rot3(np.pi)).T
+            for station in self.stations
+            for lat, lon, _ in [station.latlonalt]
+        ])
+        self.positions = np.einsum(
+            'mij,mj->mi', self.rotations, [station.coordinates for station in self.stations]
+        )
+
+    def __len__(self):
+        return len(self.stations)
+
+    def geometry(self, dates, states, frame):
+        """Azimuth, elevation, range and range rate of satellites from all the
+        stations of the network
+
+        Args:
+            dates (DateArray or list of Date): N dates
+            states (numpy.ndarray): Cartesian states of K satellites at these dates,
+                of shape (K, N, 6)
+            frame (str or Frame): Frame of the states
+        Return:
+            tuple of numpy.ndarray: azimuth (clockwise from geodetic North,
+            whatever the orientation of the station), elevation, range and
+            range rate, each of shape (M, N, K) for M stations. Angles are
+            in radians.
+        """
+
+        if not isinstance(dates, DateArray):
+            dates = DateArray(dates)
 
-        azim %= 2 * np.pi
+        # Conversion to the parent frame, shared by all stations
+        matrix, translation = get_transform(frame, self.parent_frame).matrix(dates)
+        states = np.asarray(states, dtype=float)
+        states = np.einsum('...ij,k...j->k...i', matrix, states) + translation
 
-        if azim in cls.mask[0, :]:
-            return cls.mask[1, np.where(azim == cls.mask[0, :])[0][0]]
+        shape = (len(self), len(dates), len(states))
+        azimuth, elevation, rng, rng_rate = (np.empty(shape) for i in range(4))
 
-        for next_i, mask_azim in enumerate(cls.mask[0, :]):
-            if mask_azim > azim:
-                break
-        else:
-            next_i = 0
+        for i, (rotation, position) in enumerate(zip(self.rotations, self.positions)):
 
-        x0, y0 = cls.mask[:, next_i - 1]
-        x1, y1 = cls.mask[:, next_i]
+            # Topocentric states, of shape (N, K, 3)
+            pos = np.einsum('ij,knj->nki', rotation, states[..., :3]) - position
+            vel = np.einsum('ij,knj->nki', rotation, states[..., 3:])
 
-        if next_i - 1 == -1:
-            x0 = 0
+            rng[i] = np.linalg.norm(pos, axis=-1)
+            rng_rate[i] = np.einsum('...i,...i', pos, vel) / rng[i]
+            elevation[i] = np.arcsin(pos[..., 2] / rng[i])
+            azimuth[i] = -np.arctan2(pos[..., 1], pos[..., 0]) % (2 * np.pi)
 
-        return y0 + (y1 - y0) * (azim - x0) / (x1 - x0)
+        return azimuth, elevation, rng, rng_rate
 
 
 def create_station(name, latlonalt, parent_frame=WGS84, orientation='N', mask=None):
@@ -136,7 +329,7 @@ def create_station(name, latlonalt, parent_frame=WGS84, orientation='N', mask=No
         orientation (str or float): Heading of the station
             Acceptables values are 'N', 'S', 'E', 'W' or any angle in radians
         mask: (2D array of float): First dimension is azimut counterclockwise strictly increasing.
-            Second dimension is elevation. Both in radians
+            Second dimension is elevation. Both in radians. The mask is periodic.
 
     Return:
         TopocentricFrame
@@ -6,7 +6,7 @@ import numpy as np
 from datetime import timedelta
 
 from .listeners import Speaker
-from ..frames.frames import orbit2frame
+from ..frames.frames import orbit2frame, get_frame, transform_many
 
 
 class Ephem(Speaker):
@@ -82,7 +82,34 @@ class Ephem(Speaker):
     @frame.setter
     def frame(self, frame):
         """Change the frames of all points
+
+        When all the points share the same frame, the conversion is done for
+        all of them at once (see :py:func:`~beyond.frames.frames.transform_many`)
         """
+
+        if isinstance(frame, str):
+            frame = get_frame(frame)
+
+        old_frame = self.frame
+        if frame != old_frame and all(orb.frame == old_frame for orb in self):
+            old_form = self.form
+            self.form = "cartesian"
+            try:
+                states = transform_many(
+                    [orb.date for orb in self],
+                    np.array([orb.base for orb in self]),
+                    old_frame,
+                    frame
+                )
+            except NotImplementedError:
+                pass
+            else:
+                for orb, state in zip(self, states):
+                    orb.base.setfield(state, dtype=float)
+                    orb._frame = frame
+            finally:
+                self.form = old_form
+
         for orb in self:
             orb.frame = frame
 
@@ -137,7 +164,8 @@ class Ephem(Speaker):
             y0 = self[prev_i]
             y1 = self[prev_i + 1]
 
-            result = y0[:] + (y1[:] - y0[:]) * (date.mjd - y0.date.mjd) / (y1.date.mjd - y0.date.mjd)
+            ratio = date.seconds_since(y0.date) / y1.date.seconds_since(y0.date)
+            result = y0[:] + (y1[:] - y0[:]) * ratio
 
         elif method == self.LAGRANGE:
 
@@ -151,7 +179,9 @@ class Ephem(Speaker):
 
             # selection of the subset of data, of length 'order' around the desired value
             subset = self[start:stop]
-            date_subset = np.array([x.date.mjd for x in subset])
+
+            # Dates of the subset, as seconds elapsed since the desired date
+            date_subset = np.array([x.date.seconds_since(date) for x in subset])
 
             result = np.zeros(6)
 
@@ -166,7 +196,7 @@ class Ephem(Speaker):
             for j in range(order):
                 # This mask is here to enforce the m != j in the lagrange polynomials
                 mask = date_subset != date_subset[j]
-                l_j = (date.mjd - date_subset[mask]) / (date_subset[j] - date_subset[mask])
+                l_j = -date_subset[mask] / (date_subset[j] - date_subset[mask])
                 result = result + l_j.prod() * subset[j]
 
         else:
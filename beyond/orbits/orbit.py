@@ -11,7 +11,7 @@ from ..dates import timedelta
 from ..errors import OrbitError
 from .forms import get_form, Form
 from .ephem import Ephem
-from ..frames.frames import get_frame, orbit2frame
+from ..frames.frames import get_frame, get_transform, orbit2frame
 from ..propagators import get_propagator
 from .man import Maneuver
 
@@ -239,7 +239,7 @@ Orbit =
         if new_frame != self.frame:
             self.form = 'cartesian'
             try:
-                new_coord = self.frame(self.date, self).transform(new_frame.name)
+                new_coord = get_transform(self.frame, new_frame)(self.date, self)
                 self.base.setfield(new_coord, dtype=float)
                 self._frame = new_frame
             finally:
@@ -2,7 +2,7 @@ from numpy import sqrt, zeros
 
 from ..constants import G
 from .base import NumericalPropagator
-from ..dates import Date, timedelta
+from ..dates import Date
 
 
 class Kepler(NumericalPropagator):
@@ -46,9 +46,13 @@ class Kepler(NumericalPropagator):
 
     def _newton(self, orb, step):
         """Newton's Law of Universal Gravitation
+
+        Args:
+            orb (Orbit)
+            step (float): time elapsed since the date of the orbit, in seconds
         """
 
-        date = orb.date + step
+        date = orb.date.add_seconds(step)
 
         new_body = zeros(6)
         new_body[:3] = orb[3:]
@@ -81,18 +85,19 @@ class Kepler(NumericalPropagator):
         """
 
         y_n = orb.copy()
+        step = step.total_seconds()
 
-        k1 = self._newton(y_n, timedelta(0))
-        k2 = self._newton(y_n + k1 * step.total_seconds() / 2, step / 2)
-        k3 = self._newton(y_n + k2 * step.total_seconds() / 2, step / 2)
-        k4 = self._newton(y_n + k3 * step.total_seconds(), step)
+        k1 = self._newton(y_n, 0)
+        k2 = self._newton(y_n + k1 * step / 2, step / 2)
+        k3 = self._newton(y_n + k2 * step / 2, step / 2)
+        k4 = self._newton(y_n + k3 * step, step)
 
         # This is the y_n+1 value
-        y_n_1 = y_n + step.total_seconds() / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
-        y_n_1.date = y_n.date + step
+        y_n_1 = y_n + step / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        y_n_1.date = y_n.date.add_seconds(step)
 
         for man in self.orbit.maneuvers:
-            if orb.date < man.date <= orb.date + step:
+            if orb.date < man.date <= y_n_1.date:
                 y_n_1[3:] += man.dv(y_n_1)
 
         return y_n_1
@@ -101,8 +106,9 @@ class Kepler(NumericalPropagator):
         """Simple step propagator
         """
         y_n = orb.copy()
-        y_n_1 = y_n + step.total_seconds() * self._newton(y_n, step)
-        y_n_1.date = y_n.date + step
+        step = step.total_seconds()
+        y_n_1 = y_n + step * self._newton(y_n, step)
+        y_n_1.date = y_n.date.add_seconds(step)
 
         return y_n_1
 
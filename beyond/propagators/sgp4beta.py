@@ -147,8 +147,7 @@ class Sgp4Beta:
         i0, Ω0, e0, ω0, M0, n0 = self.tle
         n0 *= 60  # conversion to min⁻¹
         if isinstance(date, Date):
-            t0 = self.tle.date.datetime
-            tdiff = (date.datetime - t0).total_seconds() / 60.
+            tdiff = date.seconds_since(self.tle.date) / 60.
         elif isinstance(date, timedelta):
             tdiff = date.total_seconds() / 60.
             date = self.tle.date + date
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Bounded caches
+
+All the caches of the library are instances of :py:class:`LruCache`, and
+may be emptied at once with :py:func:`clear_caches`.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from weakref import WeakSet
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize evictions')
+
+_caches = WeakSet()
+
+
+def clear_caches():
+    """Empty all the caches of the library, and reset their statistics
+    """
+    for cache in list(_caches):
+        cache.clear()
+
+
+class LruCache:
+    """Mapping of bounded size, discarding the least recently used entries
+    when full
+
+    Accesses are serialized, so the same cache may be used by several threads.
+
+    Args:
+        maxsize (int): Maximum number of entries. If ``None``, the cache
+            is not bounded
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Retrieve an entry, and mark it as the most recently used
+
+        Args:
+            key: Any hashable object
+            default: Value returned if the key is absent
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset the statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """Statistics of the cache, in the fashion of :py:func:`functools.lru_cache`
+
+        Return:
+            CacheInfo: named tuple of hits, misses, maxsize, currsize and evictions
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data), self.evictions)
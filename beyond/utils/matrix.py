@@ -7,43 +7,77 @@
 import numpy as np
 
 
+def _stack(rows):
+    """Build a stack of matrices from elements that may be arrays
+
+    Args:
+        rows (list of list): Elements of the matrix, floats or arrays of the same shape
+    Return:
+        numpy.ndarray: array of shape (..., 3, 3)
+    """
+    elements = np.broadcast_arrays(*[x for row in rows for x in row])
+    return np.stack(elements, axis=-1).reshape(elements[0].shape + (len(rows), len(rows[0])))
+
+
 def rot1(theta):
     """
     Args:
-        theta (float): Angle in radians
+        theta (float or numpy.ndarray): Angle in radians
     Return:
-        Rotation matrix of angle theta around the X-axis
+        Rotation matrix of angle theta around the X-axis. If theta is an array,
+        the result is a stack of matrices
     """
-    return np.array([
+    rows = [
         [1, 0, 0],
         [0, np.cos(theta), np.sin(theta)],
         [0, -np.sin(theta), np.cos(theta)]
-    ])
+    ]
+    return np.array(rows) if np.ndim(theta) == 0 else _stack(rows)
 
 
 def rot2(theta):
     """
     Args:
-        theta (float): Angle in radians
+        theta (float or numpy.ndarray): Angle in radians
     Return:
-        Rotation matrix of angle theta around the Y-axis
+        Rotation matrix of angle theta around the Y-axis. If theta is an array,
+        the result is a stack of matrices
     """
-    return np.array([
+    rows = [
         [np.cos(theta), 0, -np.sin(theta)],
         [0, 1, 0],
         [np.sin(theta), 0, np.cos(theta)]
-    ])
+    ]
+    return np.array(rows) if np.ndim(theta) == 0 else _stack(rows)
 
 
 def rot3(theta):
     """
     Args:
-        theta (float): Angle in radians
+        theta (float or numpy.ndarray): Angle in radians
     Return:
-        Rotation matrix of angle theta around the Z-axis
+        Rotation matrix of angle theta around the Z-axis. If theta is an array,
+        the result is a stack of matrices
     """
-    return np.array([
+    rows = [
         [np.cos(theta), np.sin(theta), 0],
         [-np.sin(theta), np.cos(theta), 0],
         [0, 0, 1]
-    ])
+    ]
+    return np.array(rows) if np.ndim(theta) == 0 else _stack(rows)
+
+
+def skew(vector):
+    """
+    Args:
+        vector (numpy.ndarray): 3-element vector, or array of shape (..., 3)
+    Return:
+        Skew-symmetric matrix m, such as ``m @ x == numpy.cross(vector, x)``
+    """
+    x, y, z = np.moveaxis(np.asarray(vector), -1, 0)
+    rows = [
+        [0, -z, y],
+        [z, 0, -x],
+        [-y, x, 0]
+    ]
+    return np.array(rows) if np.ndim(x) == 0 else _stack(rows)
@@ -3,18 +3,76 @@
 
 import functools
 
+from .cache import LruCache
 
-def memoize(obj):
+_MISSING = object()
+_KWARGS = object()
+
+
+def memoize(obj=None, version=None, maxsize=128):
     """Memoize decorator, as seen on
     `here <https://wiki.python.org/moin/PythonDecoratorLibrary#Memoize>`_
+
+    The results are stored in a :py:class:`~beyond.utils.cache.LruCache`,
+    keyed by the arguments of the call, which should then be hashable.
+    Calls with unhashable arguments are not cached.
+
+    Args:
+        version (callable): If provided, the cache is emptied each time the
+            value returned by this callable changes. This allows to invalidate
+            results depending on external data (e.g. EOP).
+        maxsize (int): Maximum number of results kept. If ``None``, the cache
+            is not bounded
+
+    The cache is accessible via the ``cache`` attribute of the decorated
+    function, and its statistics via ``cache_info()``.
+
+    Example:
+
+    .. code-block:: python
+
+        @memoize
+        def f(x):
+            ...
+
+        @memoize(version=lambda: EopDb.version, maxsize=1024)
+        def g(date):
+            ...
+
+        g.cache_info()
     """
-    cache = obj._cache = {}
+
+    if obj is None:
+        # decorator with arguments
+        return functools.partial(memoize, version=version, maxsize=maxsize)
+
+    cache = LruCache(maxsize)
+    state = {'version': None}
 
     @functools.wraps(obj)
     def memoizer(*args, **kwargs):
-        key = str(args) + str(kwargs)
-        if key not in cache:
-            cache[key] = obj(*args, **kwargs)
-        return cache[key]
+        if version is not None:
+            current = version()
+            if current != state['version']:
+                cache.clear()
+                state['version'] = current
+
+        key = args
+        if kwargs:
+            key += (_KWARGS,) + tuple(sorted(kwargs.items()))
+
+        try:
+            value = cache.get(key, _MISSING)
+        except TypeError:
+            # Unhashable arguments
+            return obj(*args, **kwargs)
+
+        if value is _MISSING:
+            value = cache[key] = obj(*args, **kwargs)
+        return value
+
+    memoizer.cache = cache
+    memoizer.cache_info = cache.info
+    memoizer.cache_clear = cache.clear
 
     return memoizer
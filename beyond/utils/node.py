@@ -5,7 +5,7 @@
 hierarchy or in a graph.
 """
 
-from collections import OrderedDict
+from collections import OrderedDict, deque
 
 
 class Route:
@@ -52,6 +52,15 @@ class Node:
         # [E, F, A, B] or [E, D, C, B]
     """
 
+    _version = 0
+    """Incremented each time an edge modifies the shortest paths between
+    already connected nodes. Shared by all the graphs
+    """
+
+    _size = 0
+    """Incremented each time an edge is added to any graph
+    """
+
     def __init__(self, name):
         """
         Args:
@@ -66,54 +75,77 @@ class Node:
         OrderedDict is only used as OrderedSet, so only the keys of the dict matter
         """
 
-        self.routes = {}
-        """Route mapping. What direction to follow in order to reach a
-        particular target
-        """
+        # Mapping of all the nodes of the graph by name, shared by all of them
+        self._graph = OrderedDict([(name, self)])
+        self._routing = None
 
     def __add__(self, other):
+
+        # Linking a node without any neighbor (a leaf) does not modify the
+        # shortest paths between the other nodes of the graph, so routing
+        # tables already computed remain valid, only incomplete
+        if self.neighbors and other.neighbors:
+            Node._version += 1
+        Node._size += 1
+
         self.neighbors[other] = None
         other.neighbors[self] = None
-        self._update()
-        return other
-
-    @property
-    def list(self):
-        return [self.path(node_name)[-1] for node_name in self.routes.keys()] + [self]
 
-    def _update(self, already_updated=None):
+        # Merge of the smaller graph into the larger one
+        if self._graph is not other._graph:
+            large, small = self._graph, other._graph
+            if len(large) < len(small):
+                large, small = small, large
+            for node in small.values():
+                node._graph = large
+            large.update(small)
 
-        self.routes = {}
-        for node in self.neighbors:
-            self.routes[node.name] = Route(node, 1)
+        return other
 
-            # Retrieve route from neighbors
-            for name, route in node.routes.items():
+    def _tree(self, complete=True):
+        """Shortest paths from all the nodes of the graph to this one,
+        computed by a breadth-first search, and cached until the graph is
+        modified
 
-                # check if the node actually at hand (name) is not already
-                # a direct neighbor of self
-                if name in [self.name] + [x.name for x in self.neighbors]:
-                    continue
+        Args:
+            complete (bool): If ``False``, a tree missing nodes added as
+                leaves since its computation is accepted
+        Return:
+            dict: Next node on the way to this one, for each node of the graph, by name
+        """
 
-                # check if the node actually at hand (name) is not already
-                # integrated in the self.routes or if it already is, if the
-                # path is shorter
-                if name in self.routes.keys() and self.routes[name].steps <= route.steps:
-                    continue
+        routing = self._routing
+        if routing is not None and routing[0] == Node._version:
+            if not complete or routing[1] == Node._size:
+                return routing[2]
 
-                self.routes[name] = Route(node, route.steps + 1)
+        tree = OrderedDict([(self.name, (self, None))])
+        queue = deque([self])
+        while queue:
+            node = queue.popleft()
+            for neighbor in reversed(node.neighbors):
+                if neighbor.name not in tree:
+                    tree[neighbor.name] = (neighbor, node)
+                    queue.append(neighbor)
 
-        # This set serves as a shared lock, every object that is in this set
-        # won't be updated by others. This is to avoid infinite recursions
-        if already_updated is None:
-            already_updated = set()
+        self._routing = (Node._version, Node._size, tree)
+        return tree
 
-        already_updated.add(self)
+    @property
+    def routes(self):
+        """Route mapping. What direction to follow in order to reach a
+        particular target
+        """
+        routes = {}
+        for name in self._graph:
+            if name != self.name:
+                path = self.path(name)
+                routes[name] = Route(path[1], len(path) - 1)
+        return routes
 
-        # Recursive update (with lock)
-        for node in self.neighbors:
-            if node not in already_updated:
-                node._update(already_updated)
+    @property
+    def list(self):
+        return [node for node in self._graph.values() if node is not self] + [self]
 
     def path(self, goal):
         """Get the shortest way between two nodes of the graph
@@ -126,16 +158,26 @@ class Node:
         if goal == self.name:
             return [self]
 
-        if goal not in self.routes:
+        if goal not in self._graph:
             raise ValueError("Unknown '{0}'".format(goal))
 
-        obj = self
-        path = [obj]
-        while True:
-            obj = obj.routes[goal].direction
-            path.append(obj)
-            if obj.name == goal:
-                break
+        tree = self._graph[goal]._tree(complete=False)
+
+        if self.name not in tree:
+            # This node has been added as a leaf since the computation of the
+            # tree. If its neighbor is already in the tree, it is enough to
+            # extend it, otherwise the tree is computed again
+            for neighbor in self.neighbors:
+                if neighbor.name in tree:
+                    tree[self.name] = (self, neighbor)
+                    break
+            else:
+                tree = self._graph[goal]._tree()
+
+        path = [self]
+        while path[-1].name != goal:
+            path.append(tree[path[-1].name][1])
+
         return path
 
     def steps(self, goal):
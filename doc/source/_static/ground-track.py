@@ -4,6 +4,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from beyond.config import config
+from beyond.constants import Earth
 from beyond.orbits import Tle
 from beyond.dates import Date, timedelta
 
@@ -18,21 +19,20 @@ tle = Tle("""ISS (ZARYA)
 # Conversion into `Orbit` object
 orb = tle.orbit()
 
-# Tables containing the positions of the ground track
-latitudes, longitudes = [], []
+# Positions of the satellite in the Earth rotating frame
+states = []
 for point in orb.ephemeris(Date.now(), timedelta(minutes=120), timedelta(minutes=1)):
 
     # Conversion to earth rotating frame
     point.frame = 'ITRF'
+    states.append(point.base)
 
-    # Conversion from cartesian to spherical coordinates (range, latitude, longitude)
-    point.form = 'spherical'
+# Conversion of all the positions at once to geodetic coordinates
+# (latitude, longitude, altitude) with respect to the Earth ellipsoid
+lat, lon, alt = Earth.cartesian_to_geodetic(np.array(states)).T
 
-    # Conversion from radians to degrees
-    lon, lat = np.degrees(point[1:3])
-
-    latitudes.append(lat)
-    longitudes.append(lon)
+# Conversion from radians to degrees
+latitudes, longitudes = np.degrees(lat), np.degrees(lon)
 
 im = plt.imread("earth.png")
 plt.figure(figsize=(15.2, 8.2))
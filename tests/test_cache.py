@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+from threading import Thread
+
+from beyond.dates.date import Date, timedelta
+from beyond.utils.cache import LruCache, clear_caches
+from beyond.utils.memoize import memoize
+
+
+def test_lru():
+
+    cache = LruCache(maxsize=2)
+    cache['a'] = 1
+    cache['b'] = 2
+
+    assert cache.get('a') == 1
+    cache['c'] = 3
+
+    # 'b' was the least recently used
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.info() == (1, 1, 2, 2, 1)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 2, 0, 0)
+
+
+def test_lru_threads():
+
+    cache = LruCache(maxsize=8)
+    errors = []
+
+    def run(offset):
+        try:
+            for i in range(20000):
+                key = (offset + i) % 16
+                if cache.get(key) is None:
+                    cache[key] = key
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    # Frequent switches between threads, in order to provoke concurrent accesses
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [Thread(target=run, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not errors
+    info = cache.info()
+    assert info.hits + info.misses == 80000
+    assert info.currsize == 8
+
+
+def test_memoize():
+
+    counter = []
+
+    @memoize(maxsize=2)
+    def f(date, offset=0):
+        counter.append(date)
+        return date + timedelta(seconds=offset)
+
+    date = Date(2018, 4, 5, 16, 50)
+
+    # Dates are used as keys, whatever their scale
+    assert f(date) == date
+    assert f(date.change_scale('UTC')) == date
+    assert f(Date(2018, 4, 5, 16, 50)) == date
+    assert len(counter) == 1
+
+    f(date, offset=1)
+    f(date, offset=2)
+    assert f.cache_info().evictions == 1
+    assert len(f.cache) == 2
+
+    clear_caches()
+    assert f.cache_info() == (0, 0, 2, 0, 0)
+
+    # Unhashable arguments are not cached
+    g = memoize(len)
+    assert g([1, 2]) == 2
+    assert len(g.cache) == 0
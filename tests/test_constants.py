@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from numpy.testing import assert_almost_equal
+
+from beyond.constants import Earth, Moon, Body
+
+
+def test_geodetic():
+
+    # Equator and poles
+    r, b = Earth.r, Earth.polar_radius()
+    assert_almost_equal(
+        Earth.cartesian_to_geodetic([[r + 400000., 0, 0], [0, 0, b + 10.], [0, 0, -b]]),
+        [[0, 0, 400000.], [np.pi / 2, 0, 10.], [-np.pi / 2, 0, 0]]
+    )
+
+    rng = np.random.default_rng(1234)
+    lla = np.stack([
+        rng.uniform(-np.pi / 2, np.pi / 2, 1000),
+        rng.uniform(-np.pi, np.pi, 1000),
+        rng.uniform(-1000., 40000000., 1000),
+    ], axis=-1)
+
+    for body in (Earth, Moon):
+        coord = body.geodetic_to_cartesian(lla)
+        assert coord.shape == (1000, 3)
+        assert_almost_equal(body.cartesian_to_geodetic(coord)[:, :2], lla[:, :2], decimal=12)
+        assert_almost_equal(body.cartesian_to_geodetic(coord)[:, 2], lla[:, 2], decimal=5)
+
+    # Geodetic latitude is the angle between the normal to the ellipsoid
+    # and the equator
+    lat, lon, alt = Earth.cartesian_to_geodetic(Earth.geodetic_to_cartesian([0.7, 0.3, 0.]))
+    normal = Earth.geodetic_to_cartesian([lat, lon, 1.])
+    normal -= Earth.geodetic_to_cartesian([lat, lon, 0.])
+    assert_almost_equal(np.arcsin(normal[2] / np.linalg.norm(normal)), 0.7)
+
+    # Spherical body
+    sphere = Body("Sphere", 1e20, 1000000.)
+    assert_almost_equal(
+        sphere.cartesian_to_geodetic([0, 3000000., 4000000.]),
+        [np.arcsin(0.8), np.pi / 2, 4000000.]
+    )
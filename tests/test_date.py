@@ -6,8 +6,10 @@ from unittest.mock import patch
 from pickle import dumps, loads
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
+
 from beyond.dates.eop import Eop
-from beyond.dates.date import Date, DateError, UnknownScaleError
+from beyond.dates.date import Date, DateArray, DateError, UnknownScaleError
 
 
 def test_creation():
@@ -101,6 +103,19 @@ def test_operations():
     with raises(TypeError):
         t2 = t1 - 2.5
 
+    # Sub-microsecond operations
+    t2 = t1.add_seconds(7200.0000002)
+    assert t2.d == t1.d
+    assert t2.s == 7200.0000002
+    assert t2 == t1 + timedelta(hours=2, microseconds=0.2)
+    assert t2.seconds_since(t1) == 7200.0000002
+    assert t1.seconds_since(t2) == -7200.0000002
+
+    t2 = t1.add_seconds(-43200)
+    assert t2.d == t1.d - 1
+    assert t2.s == 43200.
+    assert t1.seconds_since(Date(2015, 12, 4)) == 2 * 86400.
+
 
 def test_change_scale():
 
@@ -180,6 +195,13 @@ def test_comparison():
         assert t1 >= t2
         assert t1 <= t2
 
+        # Other types, possibly sharing the same hash
+        assert t1 != None  # noqa: E711
+        assert t1 != t1._mjd
+        assert len({t1, t1._mjd}) == 2
+        with raises(TypeError):
+            t1 < t1._mjd
+
 
 def test_leap_second():
 
@@ -257,3 +279,169 @@ def test_pickle():
     assert date1.eop.tai_utc == date2.eop.tai_utc
 
     assert date1.change_scale('UT1') == date2.change_scale('UT1')
+
+
+def test_date_array():
+
+    with patch('beyond.dates.date.EopDb.get') as m:
+        m.return_value = Eop(
+            x=0, y=0, dx=0, dy=0, dpsi=0, deps=0, lod=0, ut1_utc=0.1242558, tai_utc=36.0
+        )
+
+        start = Date(2015, 12, 6, 23, 50)
+        step = timedelta(seconds=30)
+        stop = timedelta(minutes=20)
+
+        dates = DateArray.range(start, stop, step)
+        ref = list(Date.range(start, stop, step))
+
+        assert len(dates) == len(ref) == 40
+        assert str(dates.scale) == "UTC"
+        assert isinstance(dates[0], Date)
+        assert dates[0] == start
+        assert all(x == y for x, y in zip(dates, ref))
+        assert (dates.mjd == [x.mjd for x in ref]).all()
+        assert (dates.jd == [x.jd for x in ref]).all()
+
+        # Inclusive range
+        assert len(DateArray.range(start, stop, step, inclusive=True)) == 41
+
+        # Reverse range
+        assert len(DateArray.range(start + stop, -stop, -step)) == 40
+
+        with raises(ValueError):
+            DateArray.range(start, stop, -step)
+
+        with raises(ValueError):
+            DateArray.range(start, stop, timedelta(0))
+
+        # Slicing and comparisons
+        sub = dates[10:20]
+        assert isinstance(sub, DateArray)
+        assert len(sub) == 10
+        assert sub[0] == ref[10]
+        assert (dates > ref[19]).sum() == 20
+        assert (dates[dates >= ref[30]] == DateArray(ref[30:])).all()
+
+        # Scale change
+        tt = dates.change_scale('TT')
+        assert str(tt.scale) == "TT"
+        assert (tt == dates).all()
+        assert str(tt[0]) == "2015-12-06T23:51:08.184000 TT"
+        assert tt.julian_century[0] == ref[0].change_scale('TT').julian_century
+
+        tdb = dates.change_scale('TDB')
+        assert str(tdb[0]) == str(ref[0].change_scale('TDB'))
+        assert str(tdb.change_scale('UTC')[0]) == "2015-12-06T23:50:00 UTC"
+
+        # Arithmetic
+        assert ((dates + step)[:-1] == dates[1:]).all()
+        assert ((dates - ref[0]) == 30 * np.arange(40)).all()
+
+        # Construction from MJD
+        mjd = DateArray([57362.5, 57363.25])
+        assert (mjd.d == [57362, 57363]).all()
+        assert (mjd.s == [43200, 21600]).all()
+        assert (DateArray([57362, 57363], [43200., 21600.]) == mjd).all()
+
+
+def test_scale_plan():
+
+    from beyond.dates.date import get_scale
+
+    eop = Eop(x=0, y=0, dx=0, dy=0, dpsi=0, deps=0, lod=0, ut1_utc=0.1242558, tai_utc=36.0)
+
+    utc = get_scale('UTC')
+    plan = utc.plan('TDB')
+    assert [sign for sign, oper in plan] == [1, 1, 1]
+    # The plan is compiled only once
+    assert utc.plan('TDB') is plan
+
+    with raises(ValueError):
+        utc.plan('unknown')
+
+    # Vectorized evaluation
+    mjd = np.linspace(57362, 57372, 11)
+    offsets = utc.offset(mjd, 'TDB', eop)
+    assert offsets.shape == mjd.shape
+    assert all(offsets == [utc.offset(x, 'TDB', eop) for x in mjd])
+    assert np.allclose(get_scale('TDB').offset(mjd, 'UTC', eop), -offsets, rtol=0, atol=1e-12)
+
+
+def test_lazy_eop():
+
+    with patch('beyond.dates.date.EopDb.get') as m:
+        m.return_value = Eop(
+            x=0, y=0, dx=0, dy=0, dpsi=0, deps=0, lod=0, ut1_utc=0.1242558, tai_utc=36.0
+        )
+
+        # No EOP needed for the conversion of a TAI date to the reference scale
+        t = Date(2015, 12, 6, scale='TAI')
+        assert m.call_count == 0
+        assert t.eop.ut1_utc == 0.1242558
+        assert m.call_count == 1
+        # The EOP are kept once retrieved
+        t.eop
+        assert m.call_count == 1
+
+        # The UTC scale needs TAI-UTC
+        t = Date(2015, 12, 6, 12)
+        assert m.call_count == 2
+
+        # Arithmetic during the same day does not need another query
+        t2 = t + timedelta(hours=6)
+        t3 = t - timedelta(hours=6)
+        assert m.call_count == 2
+        assert t2.s == 64800
+        assert t3.s == 21600
+        assert t2 - t == timedelta(hours=6)
+        assert str(t2) == "2015-12-06T18:00:00 UTC"
+
+        # Changing day does
+        t4 = t + timedelta(hours=18)
+        assert m.call_count == 3
+        assert str(t4) == "2015-12-07T06:00:00 UTC"
+
+        # Continuously variable scales always compute the offset again
+        t5 = Date(2015, 12, 6, scale="UT1")
+        assert m.call_count == 4
+        t5 + timedelta(hours=1)
+        assert m.call_count == 5
+
+        t6 = Date(2015, 12, 6, scale="TDB")
+        t6 + timedelta(hours=1)
+        assert m.call_count == 5
+
+        assert len(list(Date.range(t, timedelta(hours=1), timedelta(seconds=10)))) == 360
+        assert m.call_count == 5
+
+
+def test_scale_view():
+
+    with patch('beyond.dates.date.EopDb.get') as m:
+        m.return_value = Eop(
+            x=0, y=0, dx=0, dy=0, dpsi=0, deps=0, lod=0, ut1_utc=0.1242558, tai_utc=36.0
+        )
+
+        t = Date(2015, 12, 6, 12)
+        assert m.call_count == 1
+
+        tt = t.change_scale('TT')
+        ut1 = t.change_scale('UT1')
+
+        # No additional EOP query, the views share the EOP of the original date
+        assert m.call_count == 1
+        assert tt.eop is t.eop
+        assert ut1.eop is t.eop
+
+        # Views are cached
+        assert t.change_scale('TT') is tt
+        assert tt.change_scale('UTC') is t
+        assert t.change_scale('UTC') is t
+
+        # The internal representation is the same
+        assert tt._d == t._d and tt._s == t._s
+        assert tt == t == ut1
+        assert str(tt) == "2015-12-06T12:01:08.184000 TT"
+        assert str(ut1) == "2015-12-06T12:00:00.124256 UT1"
+        assert str(ut1.change_scale('TDB').change_scale('UTC')) == "2015-12-06T12:00:00 UTC"
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import shutil
+from pathlib import Path
+from pytest import fixture, raises, warns
+from unittest.mock import patch
+
+import numpy as np
+
+from beyond.config import config
+from beyond.errors import ConfigError, EopError, EopWarning
+from beyond.dates.eop import SimpleEopDatabase, TaiUtc, EopDb
+from beyond.utils.memoize import memoize
+
+
+@fixture(params=["linear", "lagrange"])
+def db(request):
+    folder = Path(__file__).parent / "data" / "pole"
+    with patch.dict(config['eop'], {'folder': folder, 'interp': request.param, 'cache': False}):
+        yield SimpleEopDatabase()
+
+
+def test_get(db):
+
+    # At the exact date of the data, no interpolation is done
+    eop = db[57000]
+    assert eop.x == 0.067555
+    assert eop.y == 0.263522
+    assert eop.dx == -0.192
+    assert eop.dy == -0.07
+    assert eop.dpsi == -88.367
+    assert eop.deps == -9.715
+    assert eop.lod == 1.017
+    assert abs(eop.ut1_utc + 0.4324422) < 1e-12
+    assert eop.tai_utc == 35.
+
+    # Between two days
+    eop = db[57000.5]
+    if db.interp == db.LINEAR:
+        assert eop.x == (0.067555 + 0.065168) / 2
+    else:
+        assert abs(eop.x - 0.0663915) < 1e-7
+
+    with raises(KeyError):
+        db[10]
+
+    # The values of the last day are kept for the whole day
+    last = db._mjd0 + len(db._data) - 1
+    assert db[last + 0.75].x == db[last].x
+    assert (db.get_many([last, last + 0.75]).x == db[last].x).all()
+
+    with raises(KeyError):
+        db[last + 1]
+    with raises(KeyError):
+        db.get_many([last, last + 1])
+
+
+def test_leap_second(db):
+
+    # No discontinuity of UT1 at the leap second of 2015-07-01
+    before = db[57203.99]
+    after = db[57204.01]
+    assert before.tai_utc == 35.
+    assert after.tai_utc == 36.
+    assert abs((after.ut1_utc - before.ut1_utc) - 1) < 1e-4
+
+
+def test_get_many(db):
+
+    mjds = np.linspace(57000, 57100, 1001)
+    eop = db.get_many(mjds)
+
+    for name in ('x', 'y', 'dx', 'dy', 'dpsi', 'deps', 'lod', 'ut1_utc', 'tai_utc'):
+        values = getattr(eop, name)
+        assert values.shape == mjds.shape
+        assert np.allclose(values, [getattr(db[mjd], name) for mjd in mjds], rtol=0, atol=1e-12)
+
+    with raises(KeyError):
+        db.get_many([57000, 10])
+
+
+def test_config():
+    with patch.dict(config['eop'], {'interp': 'cubic'}):
+        with raises(ConfigError):
+            SimpleEopDatabase()
+
+
+def test_cache(tmp_path):
+
+    for filepath in (Path(__file__).parent / "data" / "pole").iterdir():
+        shutil.copy(str(filepath), str(tmp_path))
+
+    with patch.dict(config['eop'], {'folder': tmp_path}):
+        db = SimpleEopDatabase()
+        assert (tmp_path / ".eop-cache.all.npy").exists()
+
+        # The second instanciation does not parse the text files
+        with patch('beyond.dates.eop.Finals') as m:
+            db2 = SimpleEopDatabase()
+            assert not m.called
+
+        assert db2[57000.3].__dict__ == db[57000.3].__dict__
+        assert db2.leap_seconds.data == db.leap_seconds.data
+
+        # Modification of a source file invalidates the cache
+        with (tmp_path / "tai-utc.dat").open('a') as fp:
+            fp.write("\n")
+
+        with patch('beyond.dates.eop.Finals') as m:
+            m.side_effect = FileNotFoundError
+            with raises(FileNotFoundError):
+                SimpleEopDatabase()
+
+        db3 = SimpleEopDatabase()
+        assert db3[57000.3].__dict__ == db[57000.3].__dict__
+
+
+def test_tai_utc():
+
+    leaps = TaiUtc(Path(__file__).parent / "data" / "pole" / "tai-utc.dat")
+
+    assert leaps[57203.99] == 35.
+    assert leaps[57204] == 36.
+    assert leaps[58000] == 37.
+
+    with raises(KeyError):
+        leaps[30000]
+
+    assert leaps.get_last_next(57000) == ((56109, 35.), (57204, 36.))
+    assert leaps.get_last_next(58000) == ((57754, 37.), (None, None))
+
+    assert leaps.segment(57000) == (56109, 57204)
+    assert leaps.segment(57204) == (57204, 57754)
+    assert leaps.segment(58000) == (57754, float('inf'))
+
+    mjds = np.linspace(41317, 58000, 10000)
+    assert (leaps.get_many(mjds) == [leaps[x] for x in mjds]).all()
+
+    with raises(KeyError):
+        leaps.get_many([57000, 30000])
+
+
+def test_refresh(tmp_path):
+
+    for filepath in (Path(__file__).parent / "data" / "pole").iterdir():
+        shutil.copy(str(filepath), str(tmp_path))
+
+    EopDb.register(SimpleEopDatabase, "refresh")
+
+    try:
+        with patch.dict(config['eop'], {'folder': tmp_path, 'cache': False}):
+
+            db = EopDb.db("refresh")
+            version = EopDb.version
+            assert not EopDb.refresh("refresh")
+            assert EopDb.db("refresh") is db
+
+            # Modification of the value of x for MJD 57000
+            for name in ("finals.all", "finals2000A.all"):
+                finals = tmp_path / name
+                lines = finals.read_text().splitlines(True)
+                for i, line in enumerate(lines):
+                    if line[7:15] == "57000.00":
+                        lines[i] = line[:18] + " 0.100000" + line[27:]
+                finals.write_text("".join(lines))
+
+            assert EopDb.refresh("refresh")
+            assert EopDb.version == version + 1
+            assert EopDb.db("refresh") is not db
+            assert EopDb.db("refresh")[57000].x == 0.1
+
+            # The previous instance is still usable
+            assert db[57000].x == 0.067555
+
+            # A failed reload keeps the current instance
+            current = EopDb.db("refresh")
+            with patch('beyond.dates.eop.Finals') as m:
+                m.side_effect = FileNotFoundError
+                with raises(EopError):
+                    EopDb.reload("refresh")
+            assert EopDb.db("refresh") is current
+            assert EopDb.version == version + 1
+
+            # Automatic check at each access
+            with patch.dict(config['eop'], {'refresh': 0}):
+                finals.write_text(finals.read_text() + "\n")
+                assert EopDb.db("refresh") is not current
+                assert EopDb.version == version + 2
+
+                # A source file being rewritten does not disrupt the current instance
+                current = EopDb.db("refresh")
+                finals = tmp_path / "finals2000A.all"
+                finals.write_text("".join(finals.read_text().splitlines(True)[100:]))
+                with warns(EopWarning):
+                    assert EopDb.db("refresh") is current
+                with patch.dict(config['eop'], {'missing_policy': 'error'}):
+                    with warns(EopWarning):
+                        assert EopDb.get(57000, "refresh").tai_utc == 35.
+    finally:
+        del EopDb._dbs["refresh"]
+        del EopDb._classes["refresh"]
+
+
+def test_memoize_version():
+
+    counter = []
+
+    @memoize(version=lambda: EopDb.version)
+    def f(x):
+        counter.append(x)
+        return x
+
+    assert f(1) == 1
+    assert f(1) == 1
+    assert len(counter) == 1
+
+    with patch.object(EopDb, 'version', EopDb.version + 1):
+        assert f(1) == 1
+        assert len(counter) == 2
@@ -1,6 +1,8 @@
 
 from datetime import timedelta
 
+import numpy as np
+
 from beyond.dates import Date
 from beyond.orbits import Tle
 
@@ -37,17 +39,28 @@ def test_create(ephem, start):
     assert ephem.frame.__name__ == "TEME"
 
 
+def test_frame(ephem):
+
+    ref = [orb.copy(frame="ITRF") for orb in ephem]
+    ephem.frame = "ITRF"
+
+    assert ephem.frame.__name__ == "ITRF"
+    for orb, ref_orb in zip(ephem, ref):
+        assert orb.frame.__name__ == "ITRF"
+        assert np.allclose(orb.base, ref_orb.base, rtol=0, atol=1e-8)
+
+
 def test_interpolate(ephem):
 
     orb = ephem.interpolate(ephem.start + timedelta(minutes=33, seconds=27), method="linear")
 
-    assert list(orb[:3]) == [-2343119.6282188366, 4140259.6343833795, -4744905.5643210905]
-    assert list(orb[3:]) == [-4568.825145249858, -5572.6341438079435, -2614.704833575209]
+    assert list(orb[:3]) == [-2343119.628081513, 4140259.634568929, -4744905.5642513195]
+    assert list(orb[3:]) == [-4568.825145357235, -5572.634143653398, -2614.7048337761207]
 
     orb = ephem.interpolate(ephem.start + timedelta(minutes=33, seconds=27), method="lagrange")
 
-    assert list(orb[:3]) == [-2349933.1374301873, 4150754.2288609436, -4757989.96860434]
-    assert list(orb[3:]) == [-4580.715466516539, -5588.283144821399, -2620.9683124126564]
+    assert list(orb[:3]) == [-2349933.137206703, 4150754.229194633, -4757989.968506291]
+    assert list(orb[3:]) == [-4580.715466719018, -5588.283144582675, -2620.9683127657854]
 
     with raises(ValueError):
         # We ask for a value clearly out of range
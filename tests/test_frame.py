@@ -9,11 +9,15 @@ from numpy.testing import assert_almost_equal
 from numpy.linalg import norm
 
 from beyond.errors import UnknownFrameError
-from beyond.dates import Date
+from beyond.dates import Date, DateArray, timedelta
 from beyond.dates.eop import Eop
 from beyond.orbits.orbit import Orbit
 from beyond.orbits.tle import Tle
-from beyond.frames.frames import *
+from beyond.frames.frames import (
+    CIRF, EME2000, GCRF, ITRF, MOD, PEF, TIRF, TOD,
+    Frame, _MetaFrame, get_frame, get_transform, transform_many, transform_cache
+)
+from beyond.frames.stations import create_station
 
 
 @fixture
@@ -189,6 +193,120 @@ def test_change_tle():
         assert_vector(eme2000_ref, tle)
 
 
+def test_transform_cache(ref_orbit, model_correction):
+
+    transform_cache.clear()
+
+    pv = ITRF(ref_orbit.date, ref_orbit.base).transform('TOD')
+    assert_vector(tod_ref, pv)
+    assert transform_cache.info().misses == 1
+
+    # The transformation of another orbit at the same date reuses the cache,
+    # even though the Earth rate term depends on the position
+    other = ref_orbit.base * [1.5, 0.5, 1.2, -1, 2, 0.3]
+    pv2 = ITRF(ref_orbit.date, other).transform('TOD')
+    assert transform_cache.info().hits == 1
+
+    transform_cache.clear()
+    assert_vector(ITRF(ref_orbit.date, other).transform('TOD'), pv2, (8, 10))
+
+    # Inverse transformation
+    assert_vector(other, TOD(ref_orbit.date, pv2).transform('ITRF'), (6, 9))
+    cirf = ITRF(ref_orbit.date, other).transform('CIRF')
+    assert_vector(other, CIRF(ref_orbit.date, cirf).transform('ITRF'), (6, 9))
+
+    # The size of the cache is bounded
+    transform_cache.maxsize = 2
+    for frame in ("PEF", "TOD", "MOD"):
+        ITRF(ref_orbit.date, other).transform(frame)
+    assert transform_cache.info().currsize == 2
+    transform_cache.maxsize = 1024
+
+
+def test_transform_cache_links(ref_orbit, model_correction):
+
+    transform_cache.clear()
+    transform = get_transform("ITRF", "TOD")
+    transform.matrix(ref_orbit.date)
+
+    # New frames linked to the graph do not invalidate the existing transformations
+    create_station("Cache test", (43.6, 1.44, 172.))
+    first = _MetaFrame("CacheTestA", (Frame,), {})
+    second = _MetaFrame("CacheTestB", (Frame,), {})
+    first + ITRF
+    second + first
+
+    assert get_transform("ITRF", "TOD") is transform
+    assert transform_cache.info().currsize == 1
+
+    # Whereas a link between frames already connected may modify the routes
+    second + ITRF
+    assert get_transform("ITRF", "TOD") is not transform
+    assert transform_cache.info().currsize == 0
+
+
+def test_transform_many(ref_orbit, model_correction):
+
+    dates = DateArray.range(ref_orbit.date, timedelta(hours=2), timedelta(minutes=10))
+    states = np.array([ref_orbit.base * (1 + 0.01 * i) for i in range(len(dates))])
+
+    for src, dst in [("ITRF", "EME2000"), ("EME2000", "ITRF"), ("ITRF", "GCRF"), ("TEME", "PEF")]:
+        pvs = transform_many(dates, states, src, dst)
+        assert pvs.shape == states.shape
+
+        for date, state, pv in zip(dates, states, pvs):
+            ref = get_frame(src)(date, state).transform(dst)
+            assert_vector(ref, pv, (6, 9))
+
+    pvs = transform_many(list(dates), states, ITRF, TOD)
+    assert_vector(tod_ref, pvs[0])
+
+
+def test_get_transform(ref_orbit, model_correction):
+
+    transform = get_transform("ITRF", "TOD")
+    assert get_transform(ITRF, TOD) is transform
+    assert len(transform.kernels) == 2
+    assert transform.needs_eop and transform.vectorized
+
+    assert_vector(tod_ref, transform(ref_orbit.date, ref_orbit.base))
+
+    dates = DateArray.range(ref_orbit.date, timedelta(hours=2), timedelta(minutes=10))
+    states = np.tile(ref_orbit.base, (len(dates), 1))
+    pvs = transform(dates, states)
+    assert pvs.shape == states.shape
+    assert_vector(tod_ref, pvs[0])
+
+    # Cached transformations are protected against modifications
+    matrix, translation = transform.matrix(ref_orbit.date)
+    with raises(ValueError):
+        translation += 1.
+    with raises(ValueError):
+        matrix[0, 0] = 0.
+    assert_vector(tod_ref, transform(ref_orbit.date, ref_orbit.base))
+
+    # Transformations involving frames unable to handle arrays of dates
+    iss = ref_orbit.as_frame('transform_test')
+    transform = get_transform(iss, "TOD")
+    assert not transform.vectorized
+    with raises(NotImplementedError):
+        transform(dates, states)
+
+
+def test_teme_fast_path(ref_orbit, model_correction):
+
+    # TEME is directly linked to PEF through the mean sideral time
+    transform = get_transform("TEME", "ITRF")
+    assert [owner for owner, *_ in transform.kernels] == [PEF, ITRF]
+
+    # The path through TOD differs by the nutation terms neglected by TEME
+    teme = get_transform("ITRF", "TEME")(ref_orbit.date, ref_orbit.base)
+    tod = get_transform("ITRF", "TOD")(ref_orbit.date, ref_orbit.base)
+    teme_via_tod = get_transform("TOD", "TEME")(ref_orbit.date, tod)
+    assert norm(teme[:3] - teme_via_tod[:3]) < 1.
+    assert norm(teme[3:] - teme_via_tod[3:]) < 1e-3
+
+
 def test_errors(ref_orbit):
 
     with raises(UnknownFrameError):
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from pytest import fixture
+from unittest.mock import patch
+
+from beyond.config import config
+from beyond.dates.date import Date, DateArray, timedelta
+from beyond.frames.frames import MOD, TOD, get_transform
+from beyond.frames.grid import Grid
+from beyond.frames.iau1980 import _nutation, _nutation_model, _nutation_series
+from beyond.frames.iau2010 import _xysxy2, _xysxy2_series
+
+
+@fixture
+def dates():
+    return DateArray.range(Date(2018, 4, 5, 16, 50), timedelta(days=10), timedelta(minutes=7))
+
+
+@fixture
+def grid():
+    with patch.dict(config, {'frames': {'grid': {'step': 3600}}}):
+        yield
+
+
+def test_grid(dates):
+
+    grid = Grid(_xysxy2_series, step=3600, order=8, window=2, tolerance=1e-6)
+
+    values = np.array(grid(dates))
+    assert values.shape == (3, len(dates))
+    assert np.abs(values - _xysxy2_series(dates)).max() < 1e-6
+
+    # Windows are built only once
+    assert grid.windows.info().misses == 6
+    grid(dates)
+    assert grid.windows.info().misses == 6
+
+    for date in (dates[0], dates[len(dates) // 2]):
+        assert np.abs(np.array(grid(date)) - _xysxy2_series(date)).max() < 1e-6
+
+
+def test_tolerance(dates):
+
+    # A daily grid is too coarse for this tolerance, the model is evaluated directly
+    grid = Grid(_xysxy2_series, step=86400, order=4, tolerance=1e-6)
+
+    assert grid(dates[0]) == _xysxy2_series(dates[0])
+    assert np.abs(np.array(grid(dates)) - _xysxy2_series(dates)).max() < 1e-12
+    assert all(table is None for table in grid.windows._data.values())
+
+
+def test_tabulated(grid, dates):
+
+    assert np.abs(np.array(_xysxy2(dates)) - _xysxy2_series(dates)).max() < 1e-6
+
+    # Tolerance of one micro-arcsecond, for values in degrees
+    nut = np.array(_nutation(dates, eop_correction=False))
+    assert np.abs(nut - _nutation_series(dates, 106)).max() < 1e-6 / 3600.
+
+
+def test_cache(dates):
+
+    date = dates[3]
+    transform = get_transform(TOD, MOD)
+
+    exact_nut = _nutation(date, eop_correction=False)
+    exact_mat = transform.matrix(date)
+
+    # Values cached without the grid are not reused when it is enabled
+    with patch.dict(config, {'frames': {'grid': {'step': 3600}}}):
+        nut = _nutation(date, eop_correction=False)
+        mat = transform.matrix(date)
+        assert nut == _nutation_model(date, False, 106)
+        assert nut != exact_nut
+        assert np.array_equal(mat[0], transform._compose(date)[0])
+        assert not np.array_equal(mat[0], exact_mat[0])
+
+    # and conversely
+    assert _nutation(date, eop_correction=False) == exact_nut
+    assert np.array_equal(transform.matrix(date)[0], exact_mat[0])
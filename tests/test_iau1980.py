@@ -6,7 +6,7 @@ from pytest import fixture, yield_fixture
 from unittest.mock import patch
 from numpy.testing import assert_almost_equal
 
-from beyond.dates.date import Date
+from beyond.dates.date import Date, DateArray, timedelta
 from beyond.dates.eop import Eop
 from beyond.frames.iau1980 import _earth_orientation, _precesion, _nutation, _sideral, rate
 
@@ -48,6 +48,16 @@ def test_nutation(date):
     assert_almost_equal(delta_eps, 0.0020316)
 
 
+def test_nutation_many(date):
+
+    dates = DateArray.range(date, timedelta(days=400), timedelta(days=7))
+    nut = np.array(_nutation(dates))
+
+    assert np.shape(nut) == (3, len(dates))
+    for i, d in enumerate(dates):
+        assert_almost_equal(nut[:, i], _nutation(d), 15)
+
+
 def test_sideral(date):
     gmst = _sideral(date)
     assert_almost_equal(gmst, 312.8098943)
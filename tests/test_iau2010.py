@@ -5,7 +5,7 @@ import numpy as np
 from pytest import fixture, yield_fixture
 from unittest.mock import patch
 
-from beyond.dates.date import Date
+from beyond.dates.date import Date, DateArray, timedelta
 from beyond.dates.eop import Eop
 from beyond.frames.iau2010 import _earth_orientation, _sideral, _planets, _xys, _xysxy2
 
@@ -70,4 +70,14 @@ def test_xys(date):
 
     # Check of the value of s
     _, _, s = np.degrees(_xys(date)) * 3600.
-    assert abs(s + 0.003027) < 1e-6
\ No newline at end of file
+    assert abs(s + 0.003027) < 1e-6
+
+
+def test_xys_many(date):
+
+    dates = DateArray.range(date, timedelta(days=400), timedelta(days=7))
+    xys = np.array(_xysxy2(dates))
+
+    assert xys.shape == (3, len(dates))
+    for i, d in enumerate(dates):
+        assert np.allclose(xys[:, i], _xysxy2(d), rtol=0, atol=1e-12)
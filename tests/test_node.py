@@ -87,3 +87,30 @@ def test_list():
     assert K in A.list
     assert L in A.list
     assert M in A.list
+
+
+def test_update():
+
+    S = Node('S')
+    T = Node('T')
+    U = Node('U')
+    V = Node('V')
+    W = Node('W')
+
+    S + T + U + V
+    assert S.path('V') == [S, T, U, V]
+
+    # Leaves added after the computation of the paths
+    W + V
+    assert W.path('S') == [W, V, U, T, S]
+    assert S.path('W') == [S, T, U, V, W]
+    assert set(S.list) == {S, T, U, V, W}
+
+    # Shortcut between already linked nodes
+    S + V
+    assert S.path('W') == [S, V, W]
+    assert W.path('S') == [W, V, S]
+    assert S.routes['U'].steps == 2
+
+    with raises(ValueError):
+        S.path('A')
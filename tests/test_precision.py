@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from threading import Barrier, Thread
+
+import numpy as np
+from pytest import fixture, raises
+from unittest.mock import patch
+
+from beyond.config import config
+from beyond.errors import ConfigError
+from beyond.dates.date import Date, DateArray, timedelta
+from beyond.dates.eop import Eop
+from beyond.frames.frames import get_transform
+from beyond.frames.precision import get_tier, precision
+from beyond.frames.iau1980 import _nutation, _nutation_series, _tab
+from beyond.frames.iau2010 import _xys, _xysxy2, _xysxy2_series
+
+
+@fixture
+def model_correction():
+    eop = Eop(
+        x=-0.140682, y=0.333309, dpsi=-52.195, deps=-3.875, dx=-0.205,
+        dy=-0.136, lod=1.5563, ut1_utc=-0.4399619, tai_utc=32
+    )
+    with patch('beyond.dates.date.EopDb.get', return_value=eop):
+        with patch('beyond.dates.date.EopDb.get_many', return_value=eop):
+            yield
+
+
+@fixture
+def dates(model_correction):
+    # The error budgets are valid between 1900 and 2100
+    return DateArray.range(Date(1950, 1, 1), timedelta(days=365 * 130), timedelta(days=3.3))
+
+
+def test_tier():
+
+    assert get_tier().name == "full"
+
+    with precision("fast"):
+        assert get_tier().name == "fast"
+        with precision("standard"):
+            assert get_tier().name == "standard"
+        assert get_tier().name == "fast"
+
+    with patch.dict(config, {'frames': {'precision': 'standard'}}):
+        assert get_tier().name == "standard"
+
+    with raises(ConfigError):
+        with precision("slow"):
+            pass
+
+
+def test_tier_threads():
+
+    barrier = Barrier(2)
+    results = {}
+
+    def run(name):
+        with precision(name):
+            # Both threads are inside their block at the same time
+            barrier.wait()
+            results[name] = get_tier().name
+            barrier.wait()
+        results[name, 'after'] = get_tier().name
+
+    threads = [Thread(target=run, args=(name,)) for name in ("fast", "standard")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {
+        "fast": "fast",
+        "standard": "standard",
+        ("fast", "after"): "full",
+        ("standard", "after"): "full",
+    }
+    assert get_tier().name == "full"
+
+
+def test_iau2010(dates):
+
+    full = np.array(_xysxy2_series(dates))
+
+    for name, budget in [("standard", 1e-3), ("fast", 0.1)]:
+        with precision(name):
+            assert np.abs(np.array(_xysxy2(dates)) - full).max() < budget
+
+    date = dates[0]
+
+    # Model corrections are skipped in the fast tier
+    X, Y, _ = np.degrees(_xys(date)) * 3600.
+    with precision("fast"):
+        X_fast, Y_fast, _ = np.degrees(_xys(date)) * 3600.
+
+    assert abs(X - X_fast - date.eop.dx / 1000.) < 0.1
+    assert abs(Y - Y_fast - date.eop.dy / 1000.) < 0.1
+
+
+def test_iau1980(dates):
+
+    full = np.array(_nutation_series(dates, 106))[1:] * 3600.
+
+    for name, budget in [("standard", 1e-3), ("fast", 0.1)]:
+        with precision(name):
+            nut = np.array(_nutation(dates, eop_correction=False))[1:] * 3600.
+            assert np.abs(nut - full).max() < budget
+
+    # The table is parsed once, whatever the number of terms used
+    assert len(_tab.cache) == 1
+
+    # Model corrections are skipped in the fast tier
+    date = dates[0]
+    with precision("fast"):
+        assert _nutation(date) == _nutation(date, eop_correction=False)
+
+
+def test_frames(model_correction):
+
+    dates = DateArray.range(Date(2018, 1, 1), timedelta(days=30), timedelta(hours=6))
+    states = np.tile([6378137., 0, 0, 0, 0, 0], (len(dates), 1))
+
+    for frame in ("GCRF", "EME2000"):
+        ref = get_transform("ITRF", frame)(dates, states)
+
+        for name, budget in [("standard", 1e-3), ("fast", 0.1)]:
+            with precision(name):
+                pv = get_transform("ITRF", frame)(dates, states)
+
+            # Angular error, in arcsecond
+            error = np.degrees(np.linalg.norm(pv[:, :3] - ref[:, :3], axis=1) / 6378137.) * 3600.
+            assert error.max() < budget
+
+    # The transformations cached for a date depend on the tier
+    date = dates[0]
+    ref = get_transform("ITRF", "GCRF")(date, states[0])
+    with precision("fast"):
+        assert (get_transform("ITRF", "GCRF")(date, states[0]) != ref).any()
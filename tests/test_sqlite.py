@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sqlite3
+from threading import Thread
+from pathlib import Path
+from pytest import fixture, raises
+from unittest.mock import patch
+
+import numpy as np
+
+from beyond.config import config
+from beyond.dates.eop import SimpleEopDatabase
+from beyond.dates.sqlite import SqliteEopDatabase
+
+folder = Path(__file__).parent / "data" / "pole"
+sources = [folder / "finals.all", folder / "finals2000A.all", folder / "tai-utc.dat"]
+
+
+@fixture(params=["linear", "lagrange"])
+def interp(request):
+    with patch.dict(config['eop'], {'folder': folder, 'interp': request.param, 'cache': False}):
+        yield request.param
+
+
+@fixture
+def db(interp, tmp_path):
+    db = SqliteEopDatabase(tmp_path / "eop.sqlite")
+    db.update(*sources)
+    return db
+
+
+def test_get(db):
+
+    ref = SimpleEopDatabase()
+
+    for mjd in (57000, 57000.5, 57203.99, 57204.01):
+        eop, ref_eop = db[mjd], ref[mjd]
+        for name in ("x", "y", "dx", "dy", "dpsi", "deps", "lod", "ut1_utc", "tai_utc"):
+            assert getattr(eop, name) == getattr(ref_eop, name)
+
+    with raises(KeyError):
+        db[10]
+
+    # The values of the last day are kept for the whole day
+    last = ref._mjd0 + len(ref._data) - 1
+    assert db[last + 0.75].x == ref[last + 0.75].x == ref[last].x
+    assert (db.get_many([last + 0.5]).x == ref[last].x).all()
+    with raises(KeyError):
+        db[last + 1]
+
+
+def test_get_many(db):
+
+    ref = SimpleEopDatabase()
+    mjds = np.linspace(57000, 57100, 1001).reshape(7, 143)
+
+    eop = db.get_many(mjds)
+    ref_eop = ref.get_many(mjds)
+
+    assert eop.x.shape == mjds.shape
+    assert np.allclose(eop.x, ref_eop.x, rtol=0, atol=1e-15)
+    assert np.allclose(eop.ut1_utc, ref_eop.ut1_utc, rtol=0, atol=1e-15)
+    assert (eop.tai_utc == ref_eop.tai_utc).all()
+
+    with raises(KeyError):
+        db.get_many([57000, 10])
+
+
+def test_update(interp, tmp_path):
+
+    path = tmp_path / "eop.sqlite"
+
+    # Files containing only the first days, as a previous version of the data
+    partial = []
+    for source in sources[:2]:
+        partial.append(tmp_path / source.name)
+        lines = source.read_text().splitlines(True)[:100]
+        partial[-1].write_text("".join(lines))
+
+    db = SqliteEopDatabase(path)
+    assert db.update(*partial, sources[2]) == 100 + len(db.leap_seconds.data)
+
+    with raises(KeyError):
+        db[57200]
+
+    # Only new days are written
+    total = len(db._conn.execute("SELECT mjd FROM finals").fetchall())
+    count = db.update(*sources[:2])
+    assert count == len(db._conn.execute("SELECT mjd FROM finals").fetchall()) - total
+    assert db.update(*sources) == 0
+
+    # The data is shared with a new instance, without any parsing
+    other = SqliteEopDatabase(path)
+    assert other[57200].x == db[57200].x
+    assert other.leap_seconds.data == db.leap_seconds.data
+
+    # Modifications are detected, whichever process did them
+    assert db.changed()
+    assert not other.changed()
+    with sqlite3.connect(str(path)) as conn:
+        conn.execute("UPDATE finals SET x = 0.1 WHERE mjd = 57200")
+    assert other.changed()
+    assert other[57200].x == 0.1
+
+
+def test_threads(db):
+
+    ref = db[57000.5].x
+    results = []
+
+    def query():
+        results.append((db[57000.5].x, db.get_many([57000.5, 57001.5]).x[0], db.changed()))
+
+    threads = [Thread(target=query) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [(ref, ref, True)] * 4
@@ -3,9 +3,11 @@
 import numpy as np
 from numpy.testing import assert_almost_equal
 
-from pytest import fixture
+from pytest import fixture, raises
 
-from beyond.dates import Date, timedelta
+from beyond.dates import Date, DateArray, timedelta
+from beyond.frames.frames import ITRF
+from beyond.frames.stations import create_station, StationNetwork
 from beyond.orbits import Orbit
 from beyond.orbits.tle import Tle
 from beyond.orbits.listeners import SignalEvent, MaxEvent, MaskEvent
@@ -49,11 +51,11 @@ def test_station(station):
     orb.form = 'spherical'
 
     # azimuth
-    assert abs(-np.degrees(orb.theta) - 159.75001561831209) <= 1e-9
+    assert abs(-np.degrees(orb.theta) - 159.74988666360983) <= 1e-9
     # elevation
-    assert abs(np.degrees(orb.phi) - 57.894234049230583) <= 1e-9
+    assert abs(np.degrees(orb.phi) - 57.894212927737065) <= 1e-9
     # range
-    assert abs(orb.r - 471467.65510239213) <= 1e-9
+    assert abs(orb.r - 471467.7553873544) <= 1e-9
 
     orb.frame = archive.frame
     orb.form = archive.form
@@ -109,3 +111,134 @@ def test_station_visibility(orbit, station):
     assert abs(points[-1].phi) < 1e-5
     assert points[-1].event.station == station
     assert (points[-1].date - Date(2018, 4, 5, 21, 15, 25, 169655)).total_seconds() <= 1e-5
+
+
+def test_network(station):
+
+    other = create_station('Kiruna', (67.857128, 20.964325, 385.), orientation='S')
+    network = StationNetwork([station, other])
+
+    dates = DateArray.range(Date(2018, 4, 5, 21), timedelta(minutes=20), timedelta(minutes=5))
+    orbits = [
+        Tle("""ISS (ZARYA)
+1 25544U 98067A   18124.55610684  .00001524  00000-0  30197-4 0  9997
+2 25544  51.6421 236.2139 0003381  47.8509  47.6767 15.54198229111731""").orbit(),
+        Tle("""0 SOYUZ MS-03
+1 41864U 16070A   16332.46460811 +.00003583 +00000-0 +62193-4 0  9996
+2 41864 051.6436 323.8351 0006073 261.8114 220.0268 15.53741335030385""").orbit(),
+    ]
+    points = [[orb.propagate(date) for date in dates] for orb in orbits]
+    states = np.array([[point.base for point in sat] for sat in points])
+
+    azim, elev, rng, rng_rate = network.geometry(dates, states, "TEME")
+    assert azim.shape == (2, len(dates), 2)
+
+    # Azimuths are computed from North, whatever the orientation of the station
+    north = create_station('Kiruna North', (67.857128, 20.964325, 385.))
+
+    for m, sta in enumerate([station, north]):
+        for k, sat in enumerate(points):
+            for n, point in enumerate(sat):
+                ref = point.copy(frame=sta, form='spherical')
+                assert abs(azim[m, n, k] - (-ref.theta % (2 * np.pi))) < 1e-9
+                assert abs(elev[m, n, k] - ref.phi) < 1e-9
+                assert abs(rng[m, n, k] - ref.r) < 1e-6
+                assert abs(rng_rate[m, n, k] - ref.r_dot) < 1e-6
+
+    south = create_station('Toulouse South', (43.604482, 1.443962, 172.), orientation='S')
+    assert_almost_equal(StationNetwork([south]).geometry(dates, states, "TEME")[0][0], azim[0])
+
+    with raises(ValueError):
+        StationNetwork([station, create_station('Lab', (43.6, 1.44, 172.), parent_frame=ITRF)])
+
+
+def test_relative(station):
+
+    date = Date(2018, 4, 5, 21)
+    dates = DateArray.range(date, timedelta(minutes=10), timedelta(minutes=5))
+    orb = Tle("""ISS (ZARYA)
+1 25544U 98067A   18124.55610684  .00001524  00000-0  30197-4 0  9997
+2 25544  51.6421 236.2139 0003381  47.8509  47.6767 15.54198229111731""").orbit()
+
+    points = [orb.propagate(d) for d in dates]
+    states = np.array([[point.base for point in points]] * 3)
+
+    topo = station.relative(dates, states, "TEME")
+    assert topo.shape == (3, len(dates), 6)
+
+    for n, point in enumerate(points):
+        ref = point.copy(frame=station)
+        assert_vector(ref, topo[0, n])
+        assert_vector(ref, topo[2, n])
+
+    # Single date
+    topo = station.relative(date, states[:, 0], "TEME")
+    assert topo.shape == (3, 6)
+    assert_vector(points[0].copy(frame=station), topo[1])
+
+    # The station in the frame of the satellites
+    state, matrix = station.inertial(date, "TEME")
+    assert_vector(np.zeros(6), station.relative(date, [state], "TEME")[0])
+    assert_almost_equal(matrix[:3, :3] @ matrix[:3, :3].T, np.identity(3))
+
+    # Modifications of the returned values do not alter later conversions
+    state += 1e6
+    assert_vector(points[0].copy(frame=station), station.relative(date, states[:, 0], "TEME")[1])
+
+
+def test_mask(station):
+
+    station.mask = np.array([
+        [1.97222205, 2.11184839, 2.53072742, 2.74016693, 3.00196631,
+         3.42084533, 3.71755131, 4.15388362, 4.71238898, 6.28318531],
+        [0.35255651, 0.34906585, 0.27401669, 0.18675023, 0.28099801,
+         0.16580628, 0.12915436, 0.03490659, 0.62831853, 1.3962634]])
+
+    # Mask points, interpolation and periodicity
+    assert station.get_mask(2.11184839) == 0.34906585
+    assert abs(station.get_mask(2.04203522) - 0.35081118) < 1e-8
+    assert abs(station.get_mask(1.97222205 / 2) - (0.35255651 + 1.3962634) / 2) < 1e-8
+    assert abs(station.get_mask(1.97222205 / 2 - 2 * np.pi) - (0.35255651 + 1.3962634) / 2) < 1e-8
+
+    azims = np.linspace(-10, 10, 101)
+    assert_almost_equal(station.get_mask(azims), [station.get_mask(x) for x in azims])
+
+    # Maximum in a sector
+    assert station.get_mask_max(2.6, 3.1) == 0.28099801
+    assert station.get_mask_max(2., 2.05) == station.get_mask(2.)
+    assert station.get_mask_max(6., 1.) == 1.3962634
+    assert_almost_equal(station.get_mask_max([2.6, 6.], [3.1, 1.]), [0.28099801, 1.3962634])
+
+    # A new mask replaces the previous one
+    station.mask = np.array([[0., np.pi], [0.1, 0.2]])
+    assert abs(station.get_mask(np.pi / 2) - 0.15) < 1e-12
+
+    # Modifications in place are taken into account
+    station.mask[1, :] = [0.3, 0.5]
+    assert abs(station.get_mask(np.pi / 2) - 0.4) < 1e-12
+
+
+def test_from_spherical(station):
+
+    dates = DateArray.range(Date(2018, 4, 5, 21), timedelta(minutes=10), timedelta(minutes=1))
+    orb = Tle("""ISS (ZARYA)
+1 25544U 98067A   18124.55610684  .00001524  00000-0  30197-4 0  9997
+2 25544  51.6421 236.2139 0003381  47.8509  47.6767 15.54198229111731""").orbit()
+
+    for frame in ("EME2000", "GCRF"):
+        points = [orb.propagate(d).copy(frame=frame) for d in dates]
+        measures = np.array([point.copy(frame=station, form='spherical').base for point in points])
+
+        states = station.from_spherical(dates, measures, frame)
+        assert states.shape == (len(dates), 6)
+        for point, state in zip(points, states):
+            assert_vector(point, state)
+
+    # Without the angular rates, only the position and the range rate
+    # are retrieved
+    measures[:, 4:] = 0
+    states = station.from_spherical(list(dates), measures, "GCRF")
+    for point, measure, state in zip(points, measures, states):
+        assert_almost_equal(point.base[:3], state[:3], decimal=4)
+        topo = station.relative(point.date, [state], "GCRF")[0]
+        assert abs(topo[:3] @ topo[3:] / np.linalg.norm(topo[:3]) - measure[3]) < 1e-6